@@ -2,36 +2,102 @@
 
 from __future__ import annotations
 
+import functools
 import os
+import re
 import sys
 from pathlib import Path
-from typing import Any, Dict
+from typing import Any, Dict, List, Optional, Set, Tuple
 
 import yaml
 
-from .config_validator import ConfigValidator, apply_defaults
+from .config_validator import ConfigValidator, ValidationResult, apply_defaults
 from .models import PipelineConfig
 
 
-def _expand_env(value: Any) -> Any:
-	"""Recursively expand environment variables in strings."""
+# libyaml-backed loader when PyYAML was built with it; the pure-Python
+# SafeLoader otherwise. Same safe subset of YAML either way.
+_YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+# Variable references as ``os.path.expandvars`` sees them on POSIX (``$NAME``
+# or ``${NAME}``). Only used to record which names a config refers to.
+_ENV_VAR_RE = re.compile(r"\$(\w+|\{[^}]*\})", re.ASCII)
+
+# Validation outcomes keyed on (resolved path, mtime, values of every env var
+# the file references). The validator only looks at the file and at those
+# variables, so a hit is exactly what a fresh run would report.
+_VALIDATION_CACHE: Dict[Tuple[str, int, Tuple[Tuple[str, Optional[str]], ...]], ValidationResult] = {}
+
+
+@functools.lru_cache(maxsize=8)
+def _read_yaml(resolved_path: str, mtime_ns: int) -> Dict[str, Any]:
+	"""Parse a YAML file, memoised on its path and modification time.
+
+	Only the parse is cached: env expansion and validation depend on
+	``os.environ`` and still run on every load. The returned dict is shared
+	between callers and must not be mutated in place.
+	"""
+
+	with open(resolved_path, "r", encoding="utf-8") as handle:
+		return yaml.load(handle, Loader=_YAML_LOADER) or {}
+
+
+def _expand_env(value: Any, referenced: Optional[Set[str]] = None) -> Any:
+	"""Expand environment variables in every string of a parsed YAML tree.
+
+	Strings are expanded with ``os.path.expandvars``. The tree is rebuilt
+	with an explicit stack rather than recursion, so the input (the cached
+	parse, which doubles as the validator's pre-expansion view) is never
+	mutated. Variable names seen along the way are added to ``referenced``
+	when given.
+	"""
+
+	def expand(text: str) -> str:
+		# Most strings (keywords, prompts, labels) carry no variable at all;
+		# a substring check is far cheaper than expandvars' regex.
+		if "$" not in text:
+			return text
+		if referenced is not None:
+			for match in _ENV_VAR_RE.finditer(text):
+				referenced.add(match.group(1).removeprefix("{").removesuffix("}"))
+		return os.path.expandvars(text)
 
 	if isinstance(value, str):
-		return os.path.expandvars(value)
-	if isinstance(value, list):
-		return [_expand_env(item) for item in value]
-	if isinstance(value, dict):
-		return {key: _expand_env(val) for key, val in value.items()}
-	return value
+		return expand(value)
+	if not isinstance(value, (dict, list)):
+		return value
+
+	# Each container is copied before it is pushed, and its items are then
+	# replaced in place on the copy.
+	root = dict(value) if isinstance(value, dict) else list(value)
+	stack: List[Any] = [root]
+	while stack:
+		container = stack.pop()
+		items = container.items() if isinstance(container, dict) else enumerate(container)
+		for key, item in items:
+			if isinstance(item, str):
+				container[key] = expand(item)
+			elif isinstance(item, dict):
+				container[key] = copy = dict(item)
+				stack.append(copy)
+			elif isinstance(item, list):
+				container[key] = copy = list(item)
+				stack.append(copy)
+	return root
 
 
-def load_pipeline_config(path: str | Path, validate: bool = True) -> PipelineConfig:
+def load_pipeline_config(
+	path: str | Path,
+	validate: bool = True,
+	print_summary: bool = True,
+) -> PipelineConfig:
 	"""
 	Load YAML config and return a :class:`PipelineConfig` instance.
 	
 	Args:
 		path: Path to the configuration YAML file
 		validate: Whether to perform configuration validation (default: True)
+		print_summary: Whether to print the validation summary (default: True)
 	
 	Returns:
 		PipelineConfig instance
@@ -45,22 +111,29 @@ def load_pipeline_config(path: str | Path, validate: bool = True) -> PipelineCon
 	if not config_path.exists():
 		raise FileNotFoundError(f"Config file not found: {config_path}")
 
-	with config_path.open("r", encoding="utf-8") as handle:
-		data: Dict[str, Any] = yaml.safe_load(handle) or {}
+	resolved = str(config_path.resolve())
+	mtime_ns = config_path.stat().st_mtime_ns
+	data: Dict[str, Any] = _read_yaml(resolved, mtime_ns)
 
 	# Apply default values for optional environment variables
 	data = apply_defaults(data)
 	
 	# Expand environment variables
-	expanded = _expand_env(data)
+	referenced: Set[str] = set()
+	expanded = _expand_env(data, referenced)
 	
 	# Validate configuration if requested
 	if validate:
-		validator = ConfigValidator(config_dict=data, expanded_dict=expanded)
-		result = validator.validate()
+		cache_key = (resolved, mtime_ns, tuple(sorted((name, os.environ.get(name)) for name in referenced)))
+		result = _VALIDATION_CACHE.get(cache_key)
+		if result is None:
+			validator = ConfigValidator(config_dict=data, expanded_dict=expanded)
+			result = validator.validate()
+			_VALIDATION_CACHE[cache_key] = result
 		
 		# Print validation results
-		result.print_summary()
+		if print_summary:
+			result.print_summary()
 		
 		# Exit if there are errors
 		if not result.is_valid:
@@ -5,7 +5,11 @@ from __future__ import annotations
 import os
 import re
 from dataclasses import dataclass
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+
+# ``${VAR}`` references as written in the YAML (upper-case names only).
+_ENV_VAR_RE = re.compile(r'\$\{([A-Z_][A-Z0-9_]*)\}')
 
 
 @dataclass
@@ -82,6 +86,12 @@ class ConfigValidator:
 		self.expanded_dict = expanded_dict
 		self.errors: List[ValidationError] = []
 		self.warnings: List[ValidationError] = []
+		# Whether the original config references any ${VAR}; set by
+		# _check_env_vars. When it is False the unexpanded-var check is
+		# skipped. That trades away one rare warning: a ${X} that only
+		# appears through an env value (or via a braceless $VAR) goes
+		# unreported.
+		self._had_env_vars = True
 	
 	def validate(self) -> ValidationResult:
 		"""
@@ -109,10 +119,13 @@ class ConfigValidator:
 	
 	def _check_env_vars(self) -> None:
 		"""Check if environment variables are properly set."""
+		self._had_env_vars = False
+		
 		# Find all ${VAR} patterns in config
 		env_vars_found = self._find_env_vars(self.config_dict)
 		
 		for var_name, field_path in env_vars_found:
+			self._had_env_vars = True
 			if var_name not in os.environ:
 				if var_name in self.DEFAULTS:
 					# Has default value
@@ -202,6 +215,9 @@ class ConfigValidator:
 	
 	def _check_unexpanded_vars(self) -> None:
 		"""Check for any unexpanded ${VAR} patterns that might cause issues."""
+		if not self._had_env_vars:
+			return
+		
 		unexpanded = self._find_unexpanded_vars(self.expanded_dict)
 		
 		for var_name, field_path, value in unexpanded:
@@ -211,59 +227,64 @@ class ConfigValidator:
 				severity="warning"
 			))
 	
-	def _find_env_vars(self, obj: Any, path: str = "") -> List[tuple[str, str]]:
+	def _find_env_vars(self, obj: Any) -> Iterator[Tuple[str, str]]:
 		"""
-		Recursively find all ${VAR} patterns in the config.
+		Find all ${VAR} patterns in the config.
 		
-		Returns:
-			List of (var_name, field_path) tuples
+		Yields:
+			(var_name, field_path) tuples
 		"""
-		results = []
-		
-		if isinstance(obj, str):
-			# Find all ${VAR} patterns
-			matches = re.findall(r'\$\{([A-Z_][A-Z0-9_]*)\}', obj)
-			for var_name in matches:
-				results.append((var_name, path))
-		
-		elif isinstance(obj, dict):
-			for key, value in obj.items():
-				new_path = f"{path}.{key}" if path else key
-				results.extend(self._find_env_vars(value, new_path))
-		
-		elif isinstance(obj, list):
-			for i, item in enumerate(obj):
-				new_path = f"{path}[{i}]"
-				results.extend(self._find_env_vars(item, new_path))
-		
-		return results
+		for path, value in self._iter_strings(obj):
+			# Nearly every string has no reference; a substring test is far
+			# cheaper than running the regex over it.
+			if "${" not in value:
+				continue
+			for var_name in _ENV_VAR_RE.findall(value):
+				yield var_name, _format_path(path)
 	
-	def _find_unexpanded_vars(self, obj: Any, path: str = "") -> List[tuple[str, str, str]]:
+	def _find_unexpanded_vars(self, obj: Any) -> Iterator[Tuple[str, str, str]]:
 		"""
 		Find unexpanded ${VAR} patterns in the expanded config.
 		
-		Returns:
-			List of (var_name, field_path, value) tuples
+		Yields:
+			(var_name, field_path, value) tuples
 		"""
-		results = []
-		
-		if isinstance(obj, str):
-			# Check if string still contains ${VAR} pattern
-			matches = re.findall(r'\$\{([A-Z_][A-Z0-9_]*)\}', obj)
-			for var_name in matches:
-				results.append((var_name, path, obj))
-		
-		elif isinstance(obj, dict):
-			for key, value in obj.items():
-				new_path = f"{path}.{key}" if path else key
-				results.extend(self._find_unexpanded_vars(value, new_path))
-		
-		elif isinstance(obj, list):
-			for i, item in enumerate(obj):
-				new_path = f"{path}[{i}]"
-				results.extend(self._find_unexpanded_vars(item, new_path))
+		for path, value in self._iter_strings(obj):
+			if "${" not in value:
+				continue
+			for var_name in _ENV_VAR_RE.findall(value):
+				yield var_name, _format_path(path), value
+	
+	def _iter_strings(self, obj: Any) -> Iterator[Tuple[Tuple[Any, ...], str]]:
+		"""
+		Yield every string in the config with its path, depth-first.
 		
-		return results
+		The path is a tuple of dict keys (str) and list indices (int); it is
+		only rendered to ``a.b[0]`` form for strings that actually match.
+		Walks an explicit stack, so nesting depth is not bounded by the
+		recursion limit; children are pushed in reverse to keep document
+		order.
+		"""
+		stack: List[Tuple[Tuple[Any, ...], Any]] = [((), obj)]
+		while stack:
+			path, node = stack.pop()
+			if isinstance(node, str):
+				yield path, node
+			elif isinstance(node, dict):
+				stack.extend((path + (str(key),), value) for key, value in reversed(node.items()))
+			elif isinstance(node, list):
+				stack.extend((path + (i,), node[i]) for i in range(len(node) - 1, -1, -1))
+
+
+def _format_path(path: Tuple[Any, ...]) -> str:
+	"""Render a key/index tuple as a dotted field path, e.g. ``email.recipients[0]``."""
+	rendered = ""
+	for part in path:
+		if isinstance(part, int):
+			rendered += f"[{part}]"
+		else:
+			rendered = f"{rendered}.{part}" if rendered else part
+	return rendered
 
 
 def apply_defaults(config_dict: Dict[str, Any]) -> Dict[str, Any]:
@@ -4,7 +4,8 @@ from __future__ import annotations
 
 from dataclasses import dataclass, field
 from datetime import datetime
-from typing import Any, Dict, Iterable, List, Optional
+from itertools import islice
+from typing import Any, Dict, Iterable, List, Optional, Tuple
 
 
 # ---------------------------------------------------------------------------
@@ -12,7 +13,38 @@ from typing import Any, Dict, Iterable, List, Optional
 # ---------------------------------------------------------------------------
 
 
-@dataclass
+# Per-section defaults for :meth:`PipelineConfig.from_dict`. Each YAML section
+# is merged over its defaults once, instead of a ``.get(key, default)`` per
+# field.
+_OPENAI_DEFAULTS: Dict[str, Any] = {
+	"relevance_model": "gpt-4o-mini",
+	"summarization_model": "gpt-4o-mini",
+	"temperature": 0.2,
+	"language": "zh-CN",
+}
+_FETCH_DEFAULTS: Dict[str, Any] = {
+	"max_papers_per_topic": 25,
+	"days_back": 7,
+	"request_delay": 1.0,
+}
+_RELEVANCE_DEFAULTS: Dict[str, Any] = {"pass_threshold": 60.0}
+_SUMMARIZATION_DEFAULTS: Dict[str, Any] = {
+	"task_list_size": 5,
+	"max_sections": 4,
+	"max_content_chars": 50000,
+}
+_SITE_DEFAULTS: Dict[str, Any] = {"output_dir": "site", "base_url": ""}
+_EMAIL_DEFAULTS: Dict[str, Any] = {
+	"enabled": False,
+	"smtp_port": 587,
+	"use_tls": True,
+	"use_ssl": False,
+	"timeout": 30,
+}
+_RUNTIME_DEFAULTS: Dict[str, Any] = {"mode": "offline"}
+
+
+@dataclass(frozen=True, slots=True)
 class RelevanceDimension:
 	"""Single scoring dimension for relevance evaluation."""
 
@@ -21,16 +53,16 @@ class RelevanceDimension:
 	description: Optional[str] = None
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class TopicQuery:
 	"""Query definition for fetching arXiv papers."""
 
-	categories: List[str] = field(default_factory=list)
-	include: List[str] = field(default_factory=list)
-	exclude: List[str] = field(default_factory=list)
+	categories: Tuple[str, ...] = ()
+	include: Tuple[str, ...] = ()
+	exclude: Tuple[str, ...] = ()
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class TopicConfig:
 	"""Topic level configuration."""
 
@@ -40,7 +72,7 @@ class TopicConfig:
 	interest_prompt: str
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class OpenAIConfig:
 	api_key: Optional[str]
 	base_url: Optional[str]
@@ -50,20 +82,20 @@ class OpenAIConfig:
 	language: str = "zh-CN"  # Output language: 'zh-CN' or 'en'
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class FetchConfig:
 	max_papers_per_topic: int
 	days_back: int
 	request_delay: float = 1.0
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class RelevanceConfig:
-	dimensions: List[RelevanceDimension]
+	dimensions: Tuple[RelevanceDimension, ...]
 	pass_threshold: float
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class SummarizationConfig:
 	task_list_size: int
 	max_sections: int
@@ -74,17 +106,17 @@ class SummarizationConfig:
 	max_content_chars: int = 50000
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class SiteConfig:
 	output_dir: str
 	base_url: str
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class EmailConfig:
 	enabled: bool = False
 	sender: Optional[str] = None
-	recipients: List[str] = field(default_factory=list)
+	recipients: Tuple[str, ...] = ()
 	# Empty means "follow openai.language" — EmailDigest fills in a localised
 	# default. A non-empty value is an explicit user override.
 	subject_template: str = ""
@@ -97,17 +129,17 @@ class EmailConfig:
 	timeout: int = 30
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class RuntimeConfig:
 	mode: str = "offline"
 	paper_limit: Optional[int] = None
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class PipelineConfig:
 	openai: OpenAIConfig
 	fetch: FetchConfig
-	topics: List[TopicConfig]
+	topics: Tuple[TopicConfig, ...]
 	relevance: RelevanceConfig
 	summarization: SummarizationConfig
 	site: SiteConfig
@@ -116,80 +148,68 @@ class PipelineConfig:
 
 	@staticmethod
 	def from_dict(payload: Dict[str, Any]) -> "PipelineConfig":
-		topics = [
-			TopicConfig(
-				name=item["name"],
-				label=item.get("label", item["name"].title()),
-				query=TopicQuery(
-					categories=list(item.get("query", {}).get("categories", [])),
-					include=list(item.get("query", {}).get("include", [])),
-					exclude=list(item.get("query", {}).get("exclude", [])),
-				),
-				interest_prompt=item.get("interest_prompt", ""),
-			)
-			for item in payload.get("topics", [])
-		]
+		topics = tuple(_topic_from_dict(item) for item in payload.get("topics", []))
 
-		dimensions = [
+		dimensions = tuple(
 			RelevanceDimension(
 				name=d["name"],
 				weight=float(d.get("weight", 0.0)),
 				description=d.get("description"),
 			)
-			for d in payload.get("relevance", {}).get("scoring_dimensions", [])
-		]
+			for d in (payload.get("relevance") or {}).get("scoring_dimensions", [])
+		)
 
-		openai_section = payload.get("openai", {})
-		fetch_section = payload.get("fetch", {})
-		relevance_section = payload.get("relevance", {})
-		summarization_section = payload.get("summarization", {})
-		site_section = payload.get("site", {})
-		email_section = payload.get("email", {})
-		runtime_section = payload.get("runtime", {})
+		openai_section = {**_OPENAI_DEFAULTS, **(payload.get("openai") or {})}
+		fetch_section = {**_FETCH_DEFAULTS, **(payload.get("fetch") or {})}
+		relevance_section = {**_RELEVANCE_DEFAULTS, **(payload.get("relevance") or {})}
+		summarization_section = {**_SUMMARIZATION_DEFAULTS, **(payload.get("summarization") or {})}
+		site_section = {**_SITE_DEFAULTS, **(payload.get("site") or {})}
+		email_section = {**_EMAIL_DEFAULTS, **(payload.get("email") or {})}
+		runtime_section = {**_RUNTIME_DEFAULTS, **(payload.get("runtime") or {})}
 
 		return PipelineConfig(
 			openai=OpenAIConfig(
 				api_key=openai_section.get("api_key"),
 				base_url=openai_section.get("base_url") or None,
-				relevance_model=openai_section.get("relevance_model", "gpt-4o-mini"),
-				summarization_model=openai_section.get("summarization_model", "gpt-4o-mini"),
-				temperature=float(openai_section.get("temperature", 0.2)),
-				language=openai_section.get("language", "zh-CN"),
+				relevance_model=openai_section["relevance_model"],
+				summarization_model=openai_section["summarization_model"],
+				temperature=float(openai_section["temperature"]),
+				language=openai_section["language"],
 			),
 			fetch=FetchConfig(
-				max_papers_per_topic=int(fetch_section.get("max_papers_per_topic", 25)),
-				days_back=int(fetch_section.get("days_back", 7)),
-				request_delay=float(fetch_section.get("request_delay", 1.0)),
+				max_papers_per_topic=int(fetch_section["max_papers_per_topic"]),
+				days_back=int(fetch_section["days_back"]),
+				request_delay=float(fetch_section["request_delay"]),
 			),
 			topics=topics,
 			relevance=RelevanceConfig(
 				dimensions=dimensions,
-				pass_threshold=float(relevance_section.get("pass_threshold", 60.0)),
+				pass_threshold=float(relevance_section["pass_threshold"]),
 			),
 			summarization=SummarizationConfig(
-				task_list_size=int(summarization_section.get("task_list_size", 5)),
-				max_sections=int(summarization_section.get("max_sections", 4)),
-				max_content_chars=int(summarization_section.get("max_content_chars", 50000)),
+				task_list_size=int(summarization_section["task_list_size"]),
+				max_sections=int(summarization_section["max_sections"]),
+				max_content_chars=int(summarization_section["max_content_chars"]),
 			),
 			site=SiteConfig(
-				output_dir=site_section.get("output_dir", "site"),
-				base_url=site_section.get("base_url", ""),
+				output_dir=site_section["output_dir"],
+				base_url=site_section["base_url"],
 			),
 			email=EmailConfig(
-				enabled=bool(email_section.get("enabled", False)),
+				enabled=bool(email_section["enabled"]),
 				sender=email_section.get("sender"),
-				recipients=list(email_section.get("recipients", [])),
-				subject_template=email_section.get("subject_template", "") or "",
+				recipients=_as_tuple(email_section.get("recipients")),
+				subject_template=email_section.get("subject_template") or "",
 				smtp_host=email_section.get("smtp_host"),
-				smtp_port=int(email_section.get("smtp_port", 587)),
+				smtp_port=int(email_section["smtp_port"]),
 				username=email_section.get("username"),
 				password=email_section.get("password"),
-				use_tls=bool(email_section.get("use_tls", True)),
-				use_ssl=bool(email_section.get("use_ssl", False)),
-				timeout=int(email_section.get("timeout", 30)),
+				use_tls=bool(email_section["use_tls"]),
+				use_ssl=bool(email_section["use_ssl"]),
+				timeout=int(email_section["timeout"]),
 			),
 			runtime=RuntimeConfig(
-				mode=runtime_section.get("mode", "offline"),
+				mode=runtime_section["mode"],
 				paper_limit=runtime_section.get("paper_limit"),
 			),
 		)
@@ -200,7 +220,7 @@ class PipelineConfig:
 # ---------------------------------------------------------------------------
 
 
-@dataclass
+@dataclass(slots=True)
 class PaperCandidate:
 	topic: TopicConfig
 	arxiv_id: str
@@ -216,14 +236,14 @@ class PaperCandidate:
 	comment: Optional[str] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class DimensionScore:
 	name: str
 	weight: float
 	value: float
 
 
-@dataclass
+@dataclass(slots=True)
 class ScoredPaper:
 	paper: PaperCandidate
 	scores: List[DimensionScore]
@@ -234,24 +254,27 @@ class ScoredPaper:
 			"arxiv_id": self.paper.arxiv_id,
 			"title": self.paper.title,
 			"total_score": self.total_score,
-			"scores": [score.__dict__ for score in self.scores],
+			"scores": [
+				{"name": score.name, "weight": score.weight, "value": score.value}
+				for score in self.scores
+			],
 		}
 
 
-@dataclass
+@dataclass(slots=True)
 class TaskItem:
 	question: str
 	reason: str
 
 
-@dataclass
+@dataclass(slots=True)
 class TaskFinding:
 	task: TaskItem
 	answer: str
 	confidence: float
 
 
-@dataclass
+@dataclass(slots=True)
 class CoreSummary:
 	"""Five-aspect core summary of a paper."""
 	problem: str  # What problem does it solve
@@ -261,7 +284,7 @@ class CoreSummary:
 	conclusion: str  # Conclusion
 
 
-@dataclass
+@dataclass(slots=True)
 class PaperFigure:
 	"""One figure extracted from a paper.
 
@@ -284,7 +307,7 @@ class PaperFigure:
 	stage: Optional[str] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class PaperSummary:
 	paper: PaperCandidate
 	topic: TopicConfig
@@ -313,7 +336,7 @@ class PaperSummary:
 	translations: Optional[dict] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class PipelineStats:
 	start_time: datetime
 	end_time: datetime
@@ -322,7 +345,7 @@ class PipelineStats:
 	papers_selected: int
 
 
-@dataclass
+@dataclass(slots=True)
 class PipelineResult:
 	summaries: List[PaperSummary]
 	stats: PipelineStats
@@ -334,9 +357,50 @@ class PipelineResult:
 
 
 def limit_items(items: Iterable[Any], limit: Optional[int]) -> List[Any]:
-	"""Return at most `limit` items from the iterable."""
+	"""Return at most `limit` items from the iterable.
+
+	A non-negative limit stops consuming ``items`` once it is reached, so a
+	lazy source (e.g. a generator) is never drained past what is kept.
+	"""
 
-	materialised = list(items)
 	if limit is None:
-		return materialised
-	return materialised[:limit]
+		return list(items)
+	if limit < 0:
+		# Slice semantics: drop the last ``-limit`` items.
+		return list(items)[:limit]
+	return list(islice(items, limit))
+
+
+def _as_tuple(value: Any) -> Tuple[str, ...]:
+	"""Normalise a YAML string-or-sequence field into a tuple of strings.
+
+	The common case — a YAML list that is already all strings — is copied
+	as-is, without a per-element ``str()`` pass. A bare scalar becomes a
+	one-item tuple rather than being split into characters.
+	"""
+
+	if value is None:
+		return ()
+	if isinstance(value, str):
+		return (value,)
+	if isinstance(value, (list, tuple)):
+		if all(type(item) is str for item in value):
+			return tuple(value)
+		return tuple(str(item) for item in value)
+	return (str(value),)
+
+
+def _topic_from_dict(item: Dict[str, Any]) -> TopicConfig:
+	"""Build one :class:`TopicConfig`, looking its ``query`` block up once."""
+
+	query = item.get("query") or {}
+	return TopicConfig(
+		name=item["name"],
+		label=item.get("label", item["name"].title()),
+		query=TopicQuery(
+			categories=_as_tuple(query.get("categories")),
+			include=_as_tuple(query.get("include")),
+			exclude=_as_tuple(query.get("exclude")),
+		),
+		interest_prompt=item.get("interest_prompt", ""),
+	)
@@ -2,8 +2,10 @@
 
 from __future__ import annotations
 
+import functools
 import re
-from typing import Dict, List, Optional
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Iterable, List, Optional, Tuple
 from urllib.parse import urljoin
 
 try:  # pragma: no cover - optional dependency warning suppression
@@ -22,6 +24,8 @@ except Exception:  # pragma: no cover
 	BeautifulSoup = None  # type: ignore[assignment]
 
 from core.models import PaperFigure
+from fetchers.http_session import ThreadLocalSession
+from storage.fetch_cache import FetchCache
 
 
 # Caption keywords that signal a high-value "what is this paper" figure
@@ -60,23 +64,38 @@ _SECONDARY_KEYWORDS = (
 	"示例",
 )
 
+# Concurrent page downloads in :meth:`Ar5ivParser.prefetch`. Kept small:
+# ar5iv is a free service and a topic rarely selects more than a handful.
+_PREFETCH_WORKERS = 4
+
+# Runs of blank lines that _clean collapses to a single one.
+_BLANK_LINES_RE = re.compile(r"\n{3,}")
+
 
 class Ar5ivParser:
 	"""Fetch ar5iv HTML once, then derive both a Markdown snippet and a
 	short list of key figures from it."""
 
-	def __init__(self, base_url: str = "https://ar5iv.org/html", timeout: int = 30):
+	def __init__(
+		self,
+		base_url: str = "https://ar5iv.org/html",
+		timeout: int = 30,
+		cache: Optional[FetchCache] = None,
+	):
 		self.base_url = base_url.rstrip("/")
 		self.timeout = timeout
-		if html2text is not None:
-			self._converter = html2text.HTML2Text()  # type: ignore[attr-defined]
-			self._converter.ignore_links = False
-			self._converter.body_width = 0
-		else:  # pragma: no cover - fallback when dependency unavailable
-			self._converter = None
+		# Optional cross-run cache of the Markdown output.
+		self.cache = cache
 		# Per-instance HTML cache so analyse() can call fetch_markdown +
 		# fetch_figures without hitting the network twice.
 		self._html_cache: Dict[str, Optional[str]] = {}
+		# Converted (untrimmed) Markdown per paper. html2text is the slow,
+		# pure-Python step, and a paper listed under two topics would
+		# otherwise be converted twice when the disk cache is off or stale.
+		self._markdown_cache: Dict[str, str] = {}
+		# Keep-alive sessions, one per thread, so successive papers reuse the
+		# ar5iv connection.
+		self._session = ThreadLocalSession() if requests is not None else None
 
 	# ------------------------------------------------------------------
 	# raw HTML (cached)
@@ -92,7 +111,7 @@ class Ar5ivParser:
 			self._html_cache[arxiv_id] = None
 			return None
 		try:
-			response = requests.get(self._page_url(arxiv_id), timeout=self.timeout)
+			response = self._session.get(self._page_url(arxiv_id), timeout=self.timeout)
 			response.raise_for_status()
 			html = response.text
 		except Exception as exc:  # pragma: no cover - network issues
@@ -101,22 +120,43 @@ class Ar5ivParser:
 		self._html_cache[arxiv_id] = html
 		return html
 
+	def prefetch(self, arxiv_ids: Iterable[str]) -> None:
+		"""Download several papers' pages at once into the HTML cache, so
+		the per-paper analysis that follows does not fetch them one by one.
+		Failures are cached as ``None`` exactly as in :meth:`_fetch_html`."""
+		pending = [aid for aid in dict.fromkeys(arxiv_ids) if aid not in self._html_cache]
+		if len(pending) < 2:
+			return
+		workers = min(_PREFETCH_WORKERS, len(pending))
+		with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="ar5iv") as pool:
+			list(pool.map(self._fetch_html, pending))
+
 	# ------------------------------------------------------------------
 	# markdown
 
 	def fetch_markdown(self, arxiv_id: str, max_chars: int = 12000) -> Optional[str]:
 		"""Return a Markdown representation of a paper (trimmed to max_chars)."""
-		if self._converter is None:
+		if html2text is None:
 			print("[WARN] html2text not installed; skipping ar5iv markdown.")
 			return None
-		html = self._fetch_html(arxiv_id)
-		if not html:
-			return None
-		markdown = self._converter.handle(html)
-		markdown = self._clean(markdown)
+		cache_key = f"{self._page_url(arxiv_id)}|{max_chars}"
+		if self.cache is not None:
+			cached = self.cache.get("ar5iv", cache_key)
+			if cached is not None:
+				return cached
+		markdown = self._markdown_cache.get(arxiv_id)
+		if markdown is None:
+			html = self._fetch_html(arxiv_id)
+			if not html:
+				return None
+			markdown = self._clean(self._html_to_markdown(html))
+			self._markdown_cache[arxiv_id] = markdown
 		if max_chars and len(markdown) > max_chars:
 			markdown = markdown[:max_chars] + "\n\n... (内容截断)"
-		return markdown.strip()
+		markdown = markdown.strip()
+		if self.cache is not None and markdown:
+			self.cache.put("ar5iv", cache_key, markdown)
+		return markdown
 
 	# ------------------------------------------------------------------
 	# figures
@@ -233,11 +273,7 @@ class Ar5ivParser:
 		m = re.search(r"(\d+)", label or "")
 		if not m:
 			return ""
-		num = m.group(1)
-		patterns = [
-			re.compile(rf"\bfig(?:ure)?\.?\s*{num}\b", re.IGNORECASE),
-			re.compile(rf"图\s*{num}\b"),
-		]
+		patterns = Ar5ivParser._reference_patterns(m.group(1))
 		hits: List[str] = []
 		for p in soup.find_all("p"):
 			text = p.get_text(" ", strip=True)
@@ -250,6 +286,15 @@ class Ar5ivParser:
 		joined = "\n\n".join(hits)
 		return joined[:1500]
 
+	@staticmethod
+	@functools.lru_cache(maxsize=64)
+	def _reference_patterns(num: str) -> Tuple[re.Pattern, ...]:
+		"""Compiled body-text citations of figure ``num``, built once per number."""
+		return (
+			re.compile(rf"\bfig(?:ure)?\.?\s*{num}\b", re.IGNORECASE),
+			re.compile(rf"图\s*{num}\b"),
+		)
+
 	@staticmethod
 	def _figure_score(fig: PaperFigure) -> float:
 		score = 0.0
@@ -270,8 +315,16 @@ class Ar5ivParser:
 
 	# ------------------------------------------------------------------
 
+	@staticmethod
+	def _html_to_markdown(html: str) -> str:
+		# HTML2Text keeps its parse state on the instance, so every
+		# conversion gets a fresh one: papers are analysed on several threads.
+		converter = html2text.HTML2Text()  # type: ignore[attr-defined]
+		converter.ignore_links = False
+		converter.body_width = 0
+		return converter.handle(html)
+
 	@staticmethod
 	def _clean(markdown: str) -> str:
 		# 移除重复空行，保持输出整洁
-		markdown = re.sub(r"\n{3,}", "\n\n", markdown)
-		return markdown
+		return _BLANK_LINES_RE.sub("\n\n", markdown)
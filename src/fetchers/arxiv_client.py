@@ -2,10 +2,12 @@
 
 from __future__ import annotations
 
+import functools
 import random
+import re
 from datetime import datetime, timedelta
 from time import monotonic, sleep
-from typing import List, Optional
+from typing import List, Optional, Tuple
 
 from dateutil import parser as date_parser
 from xml.etree import ElementTree as ET
@@ -54,6 +56,22 @@ _REQUEST_TIMEOUT = (15, 60)
 
 _ARXIV_API_URL = "https://export.arxiv.org/api/query"
 
+# XML namespaces of the Atom feed the API returns.
+_ATOM_NS = {"atom": "http://www.w3.org/2005/Atom", "arxiv": "http://arxiv.org/schemas/atom"}
+
+# The feed's match count, read without parsing the XML. arXiv declares the
+# opensearch namespace on the element itself, hence the attribute slack.
+_TOTAL_RESULTS_RE = re.compile(r"<opensearch:totalResults[^>]*>(\d+)<")
+
+# Trailing version of an arXiv id ("2401.12345v2" -> "v2").
+_VERSION_SUFFIX_RE = re.compile(r"v\d+$")
+
+
+def _sanitize_arxiv_id(entry_id: str) -> str:
+	"""Bare arXiv id from an entry URL (its last path segment), without
+	the version suffix. Only a trailing ``v<digits>`` is dropped."""
+	return _VERSION_SUFFIX_RE.sub("", entry_id.strip().split("/")[-1])
+
 
 class ArxivClient:
 	"""Thin wrapper around the :mod:`arxiv` package.
@@ -73,8 +91,14 @@ class ArxivClient:
 		# out. Bumped whenever a request gives up after exhausting retries,
 		# so a following topic doesn't immediately re-trigger the rate limit.
 		self._cooldown_until: float = 0.0
+		# One keep-alive session for every API call: paginated and per-topic
+		# requests then reuse the TLS connection to export.arxiv.org.
+		self._session = requests.Session() if requests is not None else None
+		if self._session is not None:
+			self._session.headers["User-Agent"] = _ARXIV_USER_AGENT
 		if arxiv is not None:
-			# arxiv.Client supports throttling parameters to control API call rate
+			# arxiv.Client spaces its page requests by ``delay_seconds`` itself,
+			# so iterating its results needs no extra sleeps.
 			self._client: Optional[arxiv.Client] = arxiv.Client(  # type: ignore[attr-defined]
 				page_size=100,
 				delay_seconds=fetch_config.request_delay,
@@ -92,19 +116,7 @@ class ArxivClient:
 		start_date: Optional[datetime] = None,
 		end_date: Optional[datetime] = None,
 	) -> str:
-		parts: List[str] = []
-
-		if topic.query.include:
-			include_expr = [self._keyword_clause(keyword) for keyword in topic.query.include]
-			parts.append(f"({' OR '.join(include_expr)})")
-
-		if topic.query.categories:
-			cat_expr = [f"cat:{cat}" for cat in topic.query.categories]
-			parts.append(f"({' OR '.join(cat_expr)})")
-
-		if topic.query.exclude:
-			exclude_expr = [self._keyword_clause(keyword) for keyword in topic.query.exclude]
-			parts.append(f"NOT ({' OR '.join(exclude_expr)})")
+		parts = list(self._query_clauses(topic.query))
 
 		# Server-side date range filter — only used when an explicit window is
 		# provided (e.g. by the backfill workflow); the weekly run still relies
@@ -119,6 +131,28 @@ class ArxivClient:
 
 		return " AND ".join(parts)
 
+	@staticmethod
+	@functools.lru_cache(maxsize=256)
+	def _query_clauses(query: TopicQuery) -> Tuple[str, ...]:
+		"""The window-independent part of a topic's query. ``TopicQuery`` is
+		frozen, so this is cached: a backfill re-queries every topic once per
+		window."""
+		parts: List[str] = []
+
+		if query.include:
+			include_expr = [ArxivClient._keyword_clause(keyword) for keyword in query.include]
+			parts.append(f"({' OR '.join(include_expr)})")
+
+		if query.categories:
+			cat_expr = [f"cat:{cat}" for cat in query.categories]
+			parts.append(f"({' OR '.join(cat_expr)})")
+
+		if query.exclude:
+			exclude_expr = [ArxivClient._keyword_clause(keyword) for keyword in query.exclude]
+			parts.append(f"NOT ({' OR '.join(exclude_expr)})")
+
+		return tuple(parts)
+
 	@staticmethod
 	def _keyword_clause(keyword: str) -> str:
 		keyword = keyword.strip()
@@ -183,21 +217,18 @@ class ArxivClient:
 		Returns the response body, or ``None`` if every attempt failed (the
 		caller treats that as "no results" and carries on).
 		"""
-		if requests is None:
+		if self._session is None:
 			print("[WARN] requests library unavailable; cannot call arXiv API.")
 			return None
 
-		headers = {"User-Agent": _ARXIV_USER_AGENT}
-
 		for attempt in range(1, _MAX_RETRIES + 1):
 			# Always wait out the polite interval (and any active cooldown)
 			# before sending — including before the very first request.
 			self._throttle()
 			try:
-				response = requests.get(
+				response = self._session.get(
 					_ARXIV_API_URL,
 					params=params,
-					headers=headers,
 					timeout=_REQUEST_TIMEOUT,
 				)
 			except Exception as exc:
@@ -297,9 +328,7 @@ class ArxivClient:
 				if end_date and published and published > end_date:
 					continue
 
-				arxiv_id = result.entry_id.split("/")[-1]
-				if "v" in arxiv_id:
-					arxiv_id = arxiv_id.split("v")[0]
+				arxiv_id = _sanitize_arxiv_id(result.entry_id)
 
 				affiliations = []
 				for author in result.authors:
@@ -331,8 +360,6 @@ class ArxivClient:
 				if len(papers) >= cap:
 					break
 
-				sleep(self.fetch_config.request_delay)
-
 		except Exception as exc:  # pragma: no cover
 			print(f"[WARN] arxiv.Client also failed: {exc}")
 
@@ -352,9 +379,7 @@ class ArxivClient:
 			return None
 
 		# Canonicalise: strip optional version suffix (2401.12345v2 -> 2401.12345)
-		clean_id = arxiv_id.strip()
-		if "v" in clean_id and clean_id.rsplit("v", 1)[-1].isdigit():
-			clean_id = clean_id.rsplit("v", 1)[0]
+		clean_id = _VERSION_SUFFIX_RE.sub("", arxiv_id.strip())
 
 		if topic is None:
 			topic = TopicConfig(
@@ -411,6 +436,13 @@ class ArxivClient:
 				print(f"[WARN] arXiv fetch failed at offset {offset}; stopping pagination for this topic.")
 				break
 
+			# A niche query often matches nothing; skip the XML parse then,
+			# and don't request a page past the last match.
+			total_match = _TOTAL_RESULTS_RE.search(xml_text)
+			total = int(total_match.group(1)) if total_match else None
+			if total == 0:
+				break
+
 			page = self._parse_fallback_response(
 				xml_text, topic, threshold_date, end_date=end_date
 			)
@@ -418,6 +450,8 @@ class ArxivClient:
 				break
 			collected.extend(page)
 			offset += batch_size
+			if total is not None and offset >= total:
+				break
 
 		return collected[:cap]
 
@@ -429,16 +463,14 @@ class ArxivClient:
 		end_date: Optional[datetime] = None,
 	) -> List[PaperCandidate]:
 		root = ET.fromstring(xml_text)
-		ns = {"atom": "http://www.w3.org/2005/Atom", "arxiv": "http://arxiv.org/schemas/atom"}
+		ns = _ATOM_NS
 		papers: List[PaperCandidate] = []
 
 		for entry in root.findall("atom:entry", ns):
 			id_element = entry.find("atom:id", ns)
 			if id_element is None or not id_element.text:
 				continue
-			arxiv_id = id_element.text.split("/")[-1]
-			if "v" in arxiv_id:
-				arxiv_id = arxiv_id.split("v")[0]
+			arxiv_id = _sanitize_arxiv_id(id_element.text)
 
 			title = (entry.findtext("atom:title", default="", namespaces=ns) or "").strip()
 			summary = (entry.findtext("atom:summary", default="", namespaces=ns) or "").strip()
@@ -0,0 +1,31 @@
+"""Stream an HTTP download into a temporary file."""
+
+from __future__ import annotations
+
+import tempfile
+from pathlib import Path
+from typing import Any
+
+
+# Read size when streaming a download to disk.
+_DOWNLOAD_CHUNK = 64 * 1024
+
+
+def download_to_tempfile(session: Any, url: str, timeout: float, suffix: str = "") -> str:
+	"""Stream ``url`` into a new temp file and return its path.
+
+	The body is written in bounded chunks rather than held in memory. On
+	any failure the partial file is removed before the error propagates, so
+	the caller only owns (and must delete) a path that was returned.
+	"""
+	with session.get(url, timeout=timeout, stream=True) as response:
+		response.raise_for_status()
+		with tempfile.NamedTemporaryFile(delete=False, suffix=suffix) as handle:
+			try:
+				for chunk in response.iter_content(chunk_size=_DOWNLOAD_CHUNK):
+					handle.write(chunk)
+			except BaseException:
+				handle.close()
+				Path(handle.name).unlink(missing_ok=True)
+				raise
+			return handle.name
@@ -0,0 +1,35 @@
+"""Keep-alive HTTP sessions that are safe to use from worker threads."""
+
+from __future__ import annotations
+
+import threading
+from typing import Any
+
+try:  # pragma: no cover
+	import requests  # type: ignore[import]
+except Exception:  # pragma: no cover
+	requests = None  # type: ignore[assignment]
+
+
+class ThreadLocalSession:
+	"""Give each thread its own ``requests.Session``.
+
+	``requests`` does not promise that a Session is thread-safe (its
+	connection pool and cookie jar are shared mutable state), and the
+	fetchers are called from the ar5iv prefetch and paper-analysis pools.
+	One session per thread keeps connection reuse within a thread without
+	sharing that state across threads.
+	"""
+
+	def __init__(self) -> None:
+		self._local = threading.local()
+
+	def _session(self) -> "requests.Session":
+		session = getattr(self._local, "session", None)
+		if session is None:
+			session = requests.Session()
+			self._local.session = session
+		return session
+
+	def get(self, url: str, **kwargs: Any) -> "requests.Response":
+		return self._session().get(url, **kwargs)
@@ -23,7 +23,7 @@ from __future__ import annotations
 import base64
 import io
 import re
-import tempfile
+import threading
 from pathlib import Path
 from typing import List, Optional, Tuple
 
@@ -44,6 +44,8 @@ except Exception:  # pragma: no cover
 
 from core.models import PaperFigure
 from fetchers.ar5iv_parser import Ar5ivParser
+from fetchers.download import download_to_tempfile
+from fetchers.http_session import ThreadLocalSession
 
 
 # A caption block starts with "Figure 3", "Fig. 3", "Fig 3" or (zh) "图 3".
@@ -54,6 +56,10 @@ _CAPTION_RE = re.compile(r"^\s*(?:figure|fig\.?|图)\s*(\d+)\b[\s:.：、,]*", r
 # Method figures live near the front of a paper; don't scan the whole thing.
 _MAX_PAGES_TO_SCAN = 14
 
+# PyMuPDF is not thread-safe, and papers are analysed on several threads.
+# Downloads run concurrently; only the fitz work is serialised.
+_FITZ_LOCK = threading.Lock()
+
 
 class PDFFigureExtractor:
 	"""Pull the single best method figure out of a paper PDF."""
@@ -73,6 +79,9 @@ class PDFFigureExtractor:
 		# WebP encode quality. WebP at ~80 keeps method figures crisp while
 		# coming in roughly a third the size of the equivalent PNG.
 		self.webp_quality = webp_quality
+		# Keep-alive sessions, one per thread, so successive PDFs reuse the
+		# arxiv.org connection.
+		self._session = ThreadLocalSession() if requests is not None else None
 
 	# ------------------------------------------------------------------
 
@@ -94,12 +103,9 @@ class PDFFigureExtractor:
 
 		tmp_path: Optional[str] = None
 		try:
-			resp = requests.get(pdf_url, timeout=self.timeout)
-			resp.raise_for_status()
-			with tempfile.NamedTemporaryFile(delete=False, suffix=".pdf") as fh:
-				fh.write(resp.content)
-				tmp_path = fh.name
-			return self._extract(tmp_path)
+			tmp_path = self._download(pdf_url)
+			with _FITZ_LOCK:
+				return self._extract(tmp_path)
 		except Exception as exc:  # pragma: no cover - network / parse issues
 			print(f"[WARN] PDF figure extraction failed for {arxiv_id or pdf_url}: {exc}")
 			return None
@@ -118,12 +124,9 @@ class PDFFigureExtractor:
 			return []
 		tmp_path: Optional[str] = None
 		try:
-			resp = requests.get(pdf_url, timeout=self.timeout)
-			resp.raise_for_status()
-			with tempfile.NamedTemporaryFile(delete=False, suffix=".pdf") as fh:
-				fh.write(resp.content)
-				tmp_path = fh.name
-			return self._extract_all(tmp_path)
+			tmp_path = self._download(pdf_url)
+			with _FITZ_LOCK:
+				return self._extract_all(tmp_path)
 		except Exception as exc:  # pragma: no cover - network / parse issues
 			print(f"[WARN] PDF figure (full) extraction failed for {arxiv_id or pdf_url}: {exc}")
 			return []
@@ -131,6 +134,10 @@ class PDFFigureExtractor:
 			if tmp_path:
 				Path(tmp_path).unlink(missing_ok=True)
 
+	def _download(self, pdf_url: str) -> str:
+		"""Stream the PDF into a temp file, deleted by the caller."""
+		return download_to_tempfile(self._session, pdf_url, self.timeout, suffix=".pdf")
+
 	# ------------------------------------------------------------------
 
 	def _extract(self, pdf_path: str) -> Optional[PaperFigure]:
@@ -439,13 +446,10 @@ class PDFFigureExtractor:
 	def _reference_text(block_texts: List[str], num: int) -> str:
 		"""Body paragraphs that mention "Figure N" — the paper's own words
 		describing the figure. Mirrors Ar5ivParser._extract_reference_text."""
-		patterns = [
-			re.compile(rf"\bfig(?:ure)?\.?\s*{num}\b", re.IGNORECASE),
-			re.compile(rf"图\s*{num}\b"),
-		]
+		patterns = Ar5ivParser._reference_patterns(str(num))
 		hits: List[str] = []
 		for text in block_texts:
-			flat = re.sub(r"\s+", " ", text).strip()
+			flat = " ".join(text.split())
 			if len(flat) < 40:
 				continue
 			# Skip the caption block itself.
@@ -2,7 +2,6 @@
 
 from __future__ import annotations
 
-import tempfile
 from pathlib import Path
 from typing import Any, Optional
 
@@ -16,11 +15,15 @@ try:  # pragma: no cover
 except Exception:  # pragma: no cover
 	OpenAI = None  # type: ignore[assignment]
 
+from fetchers.download import download_to_tempfile
+from fetchers.http_session import ThreadLocalSession
+from storage.fetch_cache import FetchCache
+
 
 class PDFParser:
 	"""Download PDF and extract text content using OpenAI API."""
 
-	def __init__(self, openai_client: Optional[object] = None, timeout: int = 30, model: Optional[str] = None, temperature: float = 0.2):
+	def __init__(self, openai_client: Optional[object] = None, timeout: int = 30, model: Optional[str] = None, temperature: float = 0.2, cache: Optional[FetchCache] = None):
 		"""
 		Initialize PDF parser.
 		
@@ -29,11 +32,17 @@ class PDFParser:
 			timeout: Request timeout in seconds
 			model: Model to use for parsing
 			temperature: Sampling temperature for the model
+			cache: Optional cross-run cache of extracted text, so the same
+				PDF is not uploaded to the LLM again
 		"""
 		self.client = openai_client
 		self.timeout = timeout
 		self.model = model
 		self.temperature = temperature
+		self.cache = cache
+		# Keep-alive sessions, one per thread, so successive PDFs reuse the
+		# arxiv.org connection.
+		self._session = ThreadLocalSession() if requests is not None else None
 
 	def fetch_text_from_pdf(self, pdf_url: str, max_chars: int = 15000) -> Optional[str]:
 		"""
@@ -50,15 +59,18 @@ class PDFParser:
 			print("[WARN] requests, OpenAI client, or model unavailable; skipping PDF parsing.")
 			return None
 
+		# Extraction output depends on the model, so it is part of the key.
+		cache_key = f"{pdf_url}|{self.model}|{max_chars}"
+		if self.cache is not None:
+			cached = self.cache.get("pdf_text", cache_key)
+			if cached is not None:
+				print(f"[INFO] Using cached PDF text for {pdf_url}")
+				return cached
+
 		tmp_path: Optional[str] = None
 		try:
 			print(f"[INFO] Downloading PDF from {pdf_url}")
-			response = requests.get(pdf_url, timeout=self.timeout)
-			response.raise_for_status()
-
-			with tempfile.NamedTemporaryFile(delete=False, suffix=".pdf") as tmp_file:
-				tmp_file.write(response.content)
-				tmp_path = tmp_file.name
+			tmp_path = download_to_tempfile(self._session, pdf_url, self.timeout, suffix=".pdf")
 
 			print("[INFO] PDF downloaded, attempting to parse with LLM...")
 			text_content = self._parse_with_llm(tmp_path)
@@ -66,6 +78,8 @@ class PDFParser:
 			if text_content and len(text_content) > max_chars:
 				text_content = text_content[:max_chars] + "\n\n... (content truncated)"
 
+			if self.cache is not None and text_content:
+				self.cache.put("pdf_text", cache_key, text_content)
 			return text_content
 
 		except Exception as exc:  # pragma: no cover
@@ -149,17 +163,30 @@ class PDFParser:
 
 	@staticmethod
 	def _extract_from_node(node: Any) -> list[str]:
-		"""Recursively extract text fields from nested response structures."""
-		results: list[str] = []
+		"""Extract text fields from nested response structures.
 
-		if isinstance(node, dict):
-			for key, value in node.items():
-				if key in {"text", "value"} and isinstance(value, str):
-					results.append(value)
-				else:
-					results.extend(PDFParser._extract_from_node(value))
-		elif isinstance(node, list):
-			for item in node:
-				results.extend(PDFParser._extract_from_node(item))
+		Walks the tree with an explicit stack instead of recursing. Only
+		containers and matched text values are pushed, so any ``str`` popped
+		is a result; children go on in reverse to keep document order.
+		"""
+		results: list[str] = []
+		stack: list[Any] = [node] if isinstance(node, (dict, list)) else []
+
+		while stack:
+			current = stack.pop()
+			if isinstance(current, str):
+				results.append(current)
+			elif isinstance(current, dict):
+				children = [
+					value
+					for key, value in current.items()
+					if isinstance(value, (dict, list))
+					or (key in {"text", "value"} and isinstance(value, str))
+				]
+				stack.extend(reversed(children))
+			else:
+				stack.extend(
+					item for item in reversed(current) if isinstance(item, (dict, list))
+				)
 
 		return results
@@ -4,7 +4,8 @@ from __future__ import annotations
 
 import json
 import re
-from typing import List
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, Optional, Sequence
 
 from core.llm_json import chat_json
 from core.models import (
@@ -15,6 +16,7 @@ from core.models import (
 	ScoredPaper,
 	TopicConfig,
 )
+from storage.fetch_cache import FetchCache
 
 try:  # pragma: no cover - OpenAI is optional for offline smoke tests
 	from openai import OpenAI  # type: ignore[import]
@@ -22,18 +24,63 @@ except Exception:  # pragma: no cover
 	OpenAI = None  # type: ignore[assignment]
 
 
+# Cue words for the offline heuristic's novelty / experiment dimensions.
+_NOVELTY_WORDS = ("novel", "new", "first", "improve", "state-of-the-art")
+_EXPERIMENT_WORDS = ("experiment", "evaluation", "benchmark", "dataset", "ablation")
+
+# How many papers of one topic are scored by the LLM at the same time.
+_LLM_SCORING_WORKERS = 8
+
+# Retries the OpenAI SDK makes on 408/409/429/5xx and connection errors,
+# with its own exponential backoff that honours Retry-After. Raised from the
+# SDK default of 2 because concurrent scoring makes 429s likelier, and a
+# call that gives up drops that paper to the much weaker heuristic.
+_LLM_MAX_RETRIES = 5
+
+
 class RelevanceRanker:
 	"""Compute relevance scores using OpenAI or heuristic fallback."""
 
-	def __init__(self, openai_config: OpenAIConfig, relevance_config: RelevanceConfig, mode: str = "offline"):
+	def __init__(
+		self,
+		openai_config: OpenAIConfig,
+		relevance_config: RelevanceConfig,
+		mode: str = "offline",
+		cache: Optional[FetchCache] = None,
+	):
 		self.openai_config = openai_config
 		self.relevance_config = relevance_config
 		self.mode = mode
+		# Optional cross-run cache of LLM scores, so re-running over the same
+		# papers (e.g. after a config tweak) does not pay for them again.
+		self.cache = cache
+
+		# The system prompt and the dimension block depend only on config, so
+		# they are built once here rather than for every paper scored.
+		language_instruction = (
+			"Respond in Simplified Chinese (zh-CN)."
+			if openai_config.language == "zh-CN"
+			else "Respond in English."
+		)
+		self._instructions = (
+			"You are a research assistant tasked with evaluating the relevance of academic papers based on user interests. "
+			"For each scoring dimension, assign a score from 0 to 100 and provide a brief rationale. "
+			f"Output only a JSON object where each dimension name is a key, with 'score' and 'reason' fields. {language_instruction}"
+		)
+		self._dimensions_payload = [
+			{
+				"name": dim.name,
+				"weight": dim.weight,
+				"description": dim.description or dim.name,
+			}
+			for dim in relevance_config.dimensions
+		]
 
 		if mode == "online" and openai_config.api_key and OpenAI is not None:
 			self._client = OpenAI(
 				api_key=openai_config.api_key,
 				base_url=openai_config.base_url or None,
+				max_retries=_LLM_MAX_RETRIES,
 			)
 		else:
 			self._client = None
@@ -41,17 +88,31 @@ class RelevanceRanker:
 	# ------------------------------------------------------------------
 
 	def score(self, topic: TopicConfig, papers: List[PaperCandidate]) -> List[ScoredPaper]:
-		scored: List[ScoredPaper] = []
-		for paper in papers:
+		# The heuristic's topic-side inputs, lower-cased once per topic rather
+		# than once per paper and dimension.
+		include = tuple(keyword.lower() for keyword in topic.query.include)
+		categories = tuple(category.lower() for category in topic.query.categories)
+		interest = topic.interest_prompt.lower()
+
+		def score_paper(paper: PaperCandidate) -> List[DimensionScore]:
 			if self._client is not None:
 				try:
-					dimension_scores = self._score_with_llm(topic, paper)
+					return self._score_with_llm(topic, paper)
 				except Exception as exc:  # pragma: no cover - network or parsing error
 					print(f"[WARN] LLM relevance scoring failed ({paper.arxiv_id}): {exc}")
-					dimension_scores = self._score_heuristic(topic, paper)
-			else:
-				dimension_scores = self._score_heuristic(topic, paper)
+			return self._score_heuristic(paper, include, categories, interest)
+
+		# Each LLM call is one network round trip, so papers are scored on a
+		# small thread pool instead of back to back; map() keeps input order.
+		if self._client is not None and len(papers) > 1:
+			workers = min(_LLM_SCORING_WORKERS, len(papers))
+			with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="relevance") as pool:
+				all_scores = list(pool.map(score_paper, papers))
+		else:
+			all_scores = [score_paper(paper) for paper in papers]
 
+		scored: List[ScoredPaper] = []
+		for paper, dimension_scores in zip(papers, all_scores):
 			total_score = sum(score.weight * score.value for score in dimension_scores)
 			scored.append(ScoredPaper(paper=paper, scores=dimension_scores, total_score=total_score))
 
@@ -63,28 +124,6 @@ class RelevanceRanker:
 		if self._client is None:
 			raise RuntimeError("OpenAI client is not available")
 
-		# Determine output language instruction
-		language_instruction = (
-			"Respond in Simplified Chinese (zh-CN)." 
-			if self.openai_config.language == "zh-CN" 
-			else "Respond in English."
-		)
-
-		instructions = (
-			"You are a research assistant tasked with evaluating the relevance of academic papers based on user interests. "
-			"For each scoring dimension, assign a score from 0 to 100 and provide a brief rationale. "
-			f"Output only a JSON object where each dimension name is a key, with 'score' and 'reason' fields. {language_instruction}"
-		)
-
-		dimensions_payload = [
-			{
-				"name": dim.name,
-				"weight": dim.weight,
-				"description": dim.description or dim.name,
-			}
-			for dim in self.relevance_config.dimensions
-		]
-
 		user_content = {
 			"user_interest": topic.interest_prompt,
 			"paper": {
@@ -92,16 +131,29 @@ class RelevanceRanker:
 				"abstract": paper.abstract,
 				"categories": paper.categories,
 			},
-			"dimensions": dimensions_payload,
+			"dimensions": self._dimensions_payload,
 		}
 
+		messages = [
+			{"role": "system", "content": self._instructions},
+			{"role": "user", "content": json.dumps(user_content, ensure_ascii=False)},
+		]
+
+		# The key is the full request, so editing the prompt, the dimensions
+		# or the model invalidates old entries without a version constant.
+		cache_key = json.dumps(
+			[self.openai_config.relevance_model, self.openai_config.temperature, messages],
+			ensure_ascii=False,
+		)
+		if self.cache is not None:
+			cached = self._cached_scores(cache_key)
+			if cached is not None:
+				return cached
+
 		data = chat_json(
 			self._client,
 			self.openai_config.relevance_model,
-			[
-				{"role": "system", "content": instructions},
-				{"role": "user", "content": json.dumps(user_content, ensure_ascii=False)},
-			],
+			messages,
 			temperature=self.openai_config.temperature,
 		)
 
@@ -112,20 +164,45 @@ class RelevanceRanker:
 			score_value = max(0.0, min(100.0, score_value))
 			dimension_scores.append(DimensionScore(name=dim.name, weight=dim.weight, value=score_value / 100.0))
 
+		if self.cache is not None:
+			values = {score.name: score.value for score in dimension_scores}
+			self.cache.put("relevance", cache_key, json.dumps(values))
 		return dimension_scores
 
+	def _cached_scores(self, cache_key: str) -> Optional[List[DimensionScore]]:
+		"""Dimension scores stored for ``cache_key``, or ``None`` on a miss
+		or an entry that no longer covers every configured dimension."""
+		raw = self.cache.get("relevance", cache_key)
+		if raw is None:
+			return None
+		try:
+			values = json.loads(raw)
+			return [
+				DimensionScore(name=dim.name, weight=dim.weight, value=float(values[dim.name]))
+				for dim in self.relevance_config.dimensions
+			]
+		except (ValueError, KeyError, TypeError):
+			return None
+
 	# ------------------------------------------------------------------
 
-	def _score_heuristic(self, topic: TopicConfig, paper: PaperCandidate) -> List[DimensionScore]:
+	def _score_heuristic(
+		self,
+		paper: PaperCandidate,
+		include: Sequence[str],
+		categories: Sequence[str],
+		interest: str,
+	) -> List[DimensionScore]:
+		"""Keyword heuristic. ``include``/``categories``/``interest`` are the
+		topic's terms, already lower-cased by :meth:`score`."""
 		text = " ".join([paper.title, paper.abstract]).lower()
-		interest = topic.interest_prompt.lower()
 
 		dimension_scores: List[DimensionScore] = []
 		for dim in self.relevance_config.dimensions:
 			if dim.name == "topic_alignment":
-				score = self._keyword_score(topic.query.include, text) * 70 + self._keyword_score(topic.query.categories, text) * 30
+				score = self._keyword_score(include, text) * 70 + self._keyword_score(categories, text) * 30
 			elif dim.name == "methodology_fit":
-				score = self._keyword_score(topic.query.include, text + " " + interest) * 80
+				score = self._keyword_score(include, text + " " + interest) * 80
 			elif dim.name == "novelty":
 				score = 40 + 60 * self._novelty_hint(text)
 			elif dim.name == "experiment_coverage":
@@ -139,20 +216,18 @@ class RelevanceRanker:
 		return dimension_scores
 
 	@staticmethod
-	def _keyword_score(keywords: List[str], text: str) -> float:
+	def _keyword_score(keywords: Sequence[str], text: str) -> float:
 		if not keywords:
 			return 0.5
-		hits = sum(1 for keyword in keywords if keyword.lower() in text)
+		hits = sum(1 for keyword in keywords if keyword in text)
 		return min(1.0, hits / max(1, len(keywords)))
 
 	@staticmethod
 	def _novelty_hint(text: str) -> float:
-		novelty_words = ["novel", "new", "first", "improve", "state-of-the-art"]
-		hits = sum(1 for word in novelty_words if word in text)
+		hits = sum(1 for word in _NOVELTY_WORDS if word in text)
 		return min(1.0, hits / 3)
 
 	@staticmethod
 	def _experiment_hint(text: str) -> float:
-		experiment_words = ["experiment", "evaluation", "benchmark", "dataset", "ablation"]
-		hits = sum(1 for word in experiment_words if word in text)
+		hits = sum(1 for word in _EXPERIMENT_WORDS if word in text)
 		return min(1.0, hits / 3)
@@ -21,6 +21,13 @@ from typing import Iterable
 from core.models import EmailConfig, PaperSummary
 
 
+# Single line breaks inside a paragraph collapse to one space in the HTML body.
+_SOFT_BREAK_RE = re.compile(r"\s*\n\s*")
+
+# RFC 5321 line limit (excluding CRLF) for a body sent without transfer encoding.
+_SMTP_MAX_LINE = 998
+
+
 # --- email chrome i18n -------------------------------------------------------
 # Only the email's own labels live here. Paper content (titles, summaries) is
 # whatever language the pipeline produced it in.
@@ -54,6 +61,29 @@ _STRINGS = {
 }
 
 
+# Static document shell around the digest table; only the rows in between are
+# rendered per send.
+_PAGE_HEAD = """<!DOCTYPE html>
+<html lang="zh">
+<head>
+  <meta charset="utf-8">
+  <meta name="viewport" content="width=device-width, initial-scale=1.0">
+  <title>LLM4ArxivPaper</title>
+</head>
+<body style="margin:0;padding:0;background-color:#f5f5f5;font-family:-apple-system,BlinkMacSystemFont,'Segoe UI',Roboto,'Helvetica Neue',Arial,sans-serif;color:#333;">
+  <table role="presentation" width="100%" cellpadding="0" cellspacing="0" style="background-color:#f5f5f5;">
+    <tr><td align="center" style="padding:0;">
+      <table role="presentation" width="700" cellpadding="0" cellspacing="0" style="max-width:700px;width:100%;background-color:#ffffff;">
+"""
+_PAGE_TAIL = """
+      </table>
+    </td></tr>
+  </table>
+</body>
+</html>
+"""
+
+
 class EmailDigest:
 	def __init__(
 		self,
@@ -65,6 +95,8 @@ class EmailDigest:
 		self.site_base_url = site_base_url.rstrip("/")
 		# Normalise to one of the two supported chrome languages.
 		self.language = "en" if str(language).lower().startswith("en") else "zh-CN"
+		# Escaped chrome labels, filled lazily by :meth:`_label`.
+		self._labels: dict[str, str] = {}
 
 	def _t(self, key: str, **kwargs: object) -> str:
 		"""Look up an email-chrome string in the configured language."""
@@ -72,6 +104,13 @@ class EmailDigest:
 		text = entry.get(self.language) or entry.get("zh-CN") or key
 		return text.format(**kwargs) if kwargs else text
 
+	def _label(self, key: str) -> str:
+		"""HTML-escaped :meth:`_t`, memoised: card labels repeat on every paper."""
+		label = self._labels.get(key)
+		if label is None:
+			label = self._labels[key] = html.escape(self._t(key))
+		return label
+
 	def _content(self, summary: PaperSummary, field: str) -> str:
 		"""A paper's text field in this instance's language.
 
@@ -119,16 +158,31 @@ class EmailDigest:
 		message["Subject"] = subject
 		message["From"] = config.sender
 		message["To"] = ", ".join(recipient_list)
-		message.set_content(body, subtype="html", charset="utf-8")
-
-		connection_cls = smtplib.SMTP_SSL if config.use_ssl else smtplib.SMTP
+		# Send the UTF-8 body as-is (8bit) rather than quoted-printable, which
+		# inflates every non-ASCII character. SMTP caps lines at 998 octets,
+		# so a body with a longer line keeps the library's own choice.
+		cte = "8bit" if self._fits_8bit(body) else None
+		message.set_content(body, subtype="html", charset="utf-8", cte=cte)
+
+		# Port 465 is implicit TLS (SMTPS): a plain connection there only stalls
+		# until the timeout, so go straight to SSL and skip the STARTTLS step.
+		use_ssl = config.use_ssl or config.smtp_port == 465
+		connection_cls = smtplib.SMTP_SSL if use_ssl else smtplib.SMTP
 		try:
 			with connection_cls(config.smtp_host, config.smtp_port, timeout=config.timeout) as smtp:
-				if config.use_tls and not config.use_ssl:
+				if config.use_tls and not use_ssl:
 					smtp.starttls()
 				if config.username and config.password:
 					smtp.login(config.username, config.password)
-				smtp.send_message(message)
+				mail_options: list[str] = []
+				if cte == "8bit":
+					smtp.ehlo_or_helo_if_needed()
+					if smtp.has_extn("8bitmime"):
+						mail_options.append("BODY=8BITMIME")
+					else:
+						# Server can't take raw 8-bit; re-encode as qp/base64.
+						message.set_content(body, subtype="html", charset="utf-8")
+				smtp.send_message(message, mail_options=mail_options)
 			print(f"[INFO] Email digest sent to {len(recipient_list)} recipient(s).")
 		except Exception as exc:  # pragma: no cover - runtime environment specific
 			print(f"[WARN] Failed to send email digest: {exc}")
@@ -145,22 +199,28 @@ class EmailDigest:
 		if total == 0:
 			content = f"""
     <tr><td style="padding:48px 30px;text-align:center;color:#6b7280;font-size:15px;line-height:1.6;">
-      {html.escape(self._t("empty"))}
+      {self._label("empty")}
     </td></tr>
 """
 			return self._wrap(header + content + footer)
 
-		topics: dict[str, list[PaperSummary]] = {}
+		# Each paper's score is computed once here and carried alongside it:
+		# the stats row needs the average, and every card prints its own.
+		topics: dict[str, list[tuple[PaperSummary, float]]] = {}
+		score_sum = 0.0
 		for summary in summaries:
-			topics.setdefault(summary.topic.label, []).append(summary)
+			score = self._score_value(summary)
+			score_sum += score
+			topics.setdefault(summary.topic.label, []).append((summary, score))
 
-		avg_score = sum(self._score_value(s) for s in summaries) / total
+		avg_score = score_sum / total
 
 		stats = self._render_stats(total, len(topics), avg_score)
 
-		sections = ""
-		for topic_label, topic_items in topics.items():
-			sections += self._render_topic(topic_label, topic_items)
+		sections = "".join(
+			self._render_topic(topic_label, topic_items)
+			for topic_label, topic_items in topics.items()
+		)
 
 		content = f"""
     <tr><td style="padding:30px;">
@@ -175,30 +235,13 @@ class EmailDigest:
 
 	@staticmethod
 	def _wrap(inner: str) -> str:
-		return f"""<!DOCTYPE html>
-<html lang="zh">
-<head>
-  <meta charset="utf-8">
-  <meta name="viewport" content="width=device-width, initial-scale=1.0">
-  <title>LLM4ArxivPaper</title>
-</head>
-<body style="margin:0;padding:0;background-color:#f5f5f5;font-family:-apple-system,BlinkMacSystemFont,'Segoe UI',Roboto,'Helvetica Neue',Arial,sans-serif;color:#333;">
-  <table role="presentation" width="100%" cellpadding="0" cellspacing="0" style="background-color:#f5f5f5;">
-    <tr><td align="center" style="padding:0;">
-      <table role="presentation" width="700" cellpadding="0" cellspacing="0" style="max-width:700px;width:100%;background-color:#ffffff;">
-{inner}
-      </table>
-    </td></tr>
-  </table>
-</body>
-</html>
-"""
+		return _PAGE_HEAD + inner + _PAGE_TAIL
 
 	def _render_header(self) -> str:
 		return f"""
     <tr><td style="background:linear-gradient(135deg,#2563eb 0%,#1d4ed8 100%);padding:36px 30px;text-align:center;">
       <div style="margin:0 0 6px;font-size:26px;font-weight:700;color:#ffffff;">LLM4ArxivPaper</div>
-      <div style="margin:0;font-size:15px;color:#dbeafe;">{html.escape(self._t("subtitle"))}</div>
+      <div style="margin:0;font-size:15px;color:#dbeafe;">{self._label("subtitle")}</div>
     </td></tr>
 """
 
@@ -219,7 +262,7 @@ class EmailDigest:
 		if self.site_base_url:
 			button = f"""
       <tr><td style="text-align:center;padding-top:18px;">
-        <a href="{html.escape(self.site_base_url)}" style="display:inline-block;background:#2563eb;color:#ffffff;padding:11px 28px;border-radius:6px;text-decoration:none;font-weight:600;font-size:14px;">{html.escape(self._t("view_report"))}</a>
+        <a href="{html.escape(self.site_base_url)}" style="display:inline-block;background:#2563eb;color:#ffffff;padding:11px 28px;border-radius:6px;text-decoration:none;font-weight:600;font-size:14px;">{self._label("view_report")}</a>
       </td></tr>
 """
 
@@ -237,9 +280,9 @@ class EmailDigest:
     <tr><td style="height:6px;background-color:#f8f9fa;line-height:6px;">&nbsp;</td></tr>
 """
 
-	def _render_topic(self, topic_label: str, items: list[PaperSummary]) -> str:
+	def _render_topic(self, topic_label: str, items: list[tuple[PaperSummary, float]]) -> str:
 		badge = self._t("papers_badge", n=len(items))
-		cards = "".join(self._render_card(s) for s in items)
+		cards = "".join(self._render_card(s, score) for s, score in items)
 		return f"""
       <table role="presentation" width="100%" cellpadding="0" cellspacing="0" style="margin-bottom:28px;">
         <tr><td style="border-bottom:2px solid #e5e7eb;padding-bottom:8px;">
@@ -251,7 +294,7 @@ class EmailDigest:
       </table>
 """
 
-	def _render_card(self, summary: PaperSummary) -> str:
+	def _render_card(self, summary: PaperSummary, score_value: float) -> str:
 		paper = summary.paper
 		url = (
 			f"{self.site_base_url}/papers/{paper.arxiv_id}"
@@ -260,7 +303,7 @@ class EmailDigest:
 		)
 		url = html.escape(url)
 		title = html.escape(paper.title or paper.arxiv_id)
-		score = f"{self._score_value(summary):.1f}"
+		score = f"{score_value:.1f}"
 
 		# Authors + affiliations, one muted line.
 		meta_bits: list[str] = []
@@ -289,7 +332,7 @@ class EmailDigest:
           <tr><td style="padding-bottom:10px;">
             <table role="presentation" width="100%" cellpadding="0" cellspacing="0" style="background:#f8fafc;border-left:3px solid #2563eb;">
               <tr><td style="padding:10px 12px;">
-                <div style="font-size:11px;font-weight:700;color:#2563eb;text-transform:uppercase;letter-spacing:0.4px;margin-bottom:3px;">{html.escape(self._t("why_matters"))}</div>
+                <div style="font-size:11px;font-weight:700;color:#2563eb;text-transform:uppercase;letter-spacing:0.4px;margin-bottom:3px;">{self._label("why_matters")}</div>
                 <div style="font-size:13px;color:#374151;line-height:1.6;">{self._render_text(rel, limit=320)}</div>
               </td></tr>
             </table>
@@ -308,8 +351,8 @@ class EmailDigest:
           <tr><td style="border-top:1px solid #f3f4f6;padding-top:10px;">
             <table role="presentation" width="100%" cellpadding="0" cellspacing="0">
               <tr>
-                <td style="font-size:12px;color:#9ca3af;">{html.escape(self._t("relevance"))}: <strong style="color:#2563eb;">{score}</strong></td>
-                <td align="right"><a href="{url}" style="background:#eff6ff;color:#2563eb;padding:5px 14px;border-radius:6px;text-decoration:none;font-size:12px;font-weight:600;">{html.escape(self._t("view_details"))}</a></td>
+                <td style="font-size:12px;color:#9ca3af;">{self._label("relevance")}: <strong style="color:#2563eb;">{score}</strong></td>
+                <td align="right"><a href="{url}" style="background:#eff6ff;color:#2563eb;padding:5px 14px;border-radius:6px;text-decoration:none;font-size:12px;font-weight:600;">{self._label("view_details")}</a></td>
               </tr>
             </table>
           </td></tr>
@@ -336,15 +379,15 @@ class EmailDigest:
 		if self.site_base_url:
 			site_link = f"""
       <div style="font-size:13px;margin-bottom:10px;">
-        <a href="{html.escape(self.site_base_url)}" style="color:#2563eb;text-decoration:none;">{html.escape(self._t("visit_site"))}</a>
+        <a href="{html.escape(self.site_base_url)}" style="color:#2563eb;text-decoration:none;">{self._label("visit_site")}</a>
       </div>
 """
 		return f"""
     <tr><td style="background:#f8f9fa;padding:26px 30px;text-align:center;border-top:1px solid #e5e7eb;">
       <div style="font-size:14px;color:#6b7280;margin-bottom:6px;"><strong>LLM4ArxivPaper</strong></div>
-      <div style="font-size:13px;color:#9ca3af;margin-bottom:10px;">{html.escape(self._t("footer_tagline"))}</div>
+      <div style="font-size:13px;color:#9ca3af;margin-bottom:10px;">{self._label("footer_tagline")}</div>
       {site_link}
-      <div style="font-size:12px;color:#9ca3af;">{html.escape(self._t("updated"))} {update_time}</div>
+      <div style="font-size:12px;color:#9ca3af;">{self._label("updated")} {update_time}</div>
     </td></tr>
 """
 
@@ -359,6 +402,11 @@ class EmailDigest:
 		value = sum(s.weight * s.value for s in scores)
 		return (value / total_weight) * 100
 
+	@staticmethod
+	def _fits_8bit(body: str) -> bool:
+		"""Whether every line of ``body`` fits SMTP's 998-octet line limit."""
+		return all(len(line) <= _SMTP_MAX_LINE for line in body.encode("utf-8").splitlines())
+
 	@staticmethod
 	def _render_text(text: str, limit: int) -> str:
 		"""Truncate plain text to ``limit`` chars, THEN HTML-escape and turn
@@ -374,5 +422,5 @@ class EmailDigest:
 		paragraphs = [p.strip() for p in plain.split("\n\n") if p.strip()]
 		if not paragraphs:
 			return html.escape(plain)
-		escaped = [html.escape(re.sub(r"\s*\n\s*", " ", p)) for p in paragraphs]
+		escaped = [html.escape(_SOFT_BREAK_RE.sub(" ", p)) for p in paragraphs]
 		return "<br/><br/>".join(escaped)
@@ -0,0 +1,110 @@
+"""Small on-disk TTL cache for fetched paper text and LLM relevance scores.
+
+Re-running the pipeline over overlapping windows (or re-analysing one paper
+while iterating on prompts) would otherwise re-download the same ar5iv page,
+re-upload the same PDF to the LLM for text extraction and re-score the same
+abstracts. Entries are plain text files named by a hash of their key:
+
+- ``{cache_dir}/{namespace}/{sha1(key)}.txt``
+
+An entry is fresh while its mtime is younger than ``ttl``. Only successful
+fetches are stored, so a paper ar5iv hasn't rendered yet is retried on the
+next run. Once a namespace overshoots ``max_entries`` by a margin, the
+oldest files are dropped to bring it back to ``max_entries``.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import os
+import threading
+import time
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+
+_DEFAULT_CACHE_DIR = Path.home() / ".cache" / "llm4arxiv"
+_DEFAULT_TTL = 24 * 3600.0
+
+
+@dataclass
+class FetchCache:
+	"""Text cache on the local filesystem, keyed by ``(namespace, key)``."""
+
+	cache_dir: Path
+	ttl: float = _DEFAULT_TTL
+	max_entries: int = 512
+	# Writes per namespace directory since it was last scanned for eviction.
+	_writes: Dict[Path, int] = field(default_factory=dict, init=False, repr=False)
+
+	@classmethod
+	def from_env(cls) -> Optional["FetchCache"]:
+		"""Build from the optional ``FETCH_CACHE_DIR`` / ``FETCH_CACHE_TTL``
+		env vars. A TTL of ``0`` disables caching (returns ``None``)."""
+		override = os.environ.get("FETCH_CACHE_DIR")
+		try:
+			ttl = float(os.environ.get("FETCH_CACHE_TTL", _DEFAULT_TTL))
+		except ValueError:
+			ttl = _DEFAULT_TTL
+		if ttl <= 0:
+			return None
+		return cls(cache_dir=Path(override) if override else _DEFAULT_CACHE_DIR, ttl=ttl)
+
+	# ------------------------------------------------------------------
+
+	def _path(self, namespace: str, key: str) -> Path:
+		digest = hashlib.sha1(key.encode("utf-8")).hexdigest()
+		return self.cache_dir / namespace / f"{digest}.txt"
+
+	def get(self, namespace: str, key: str) -> Optional[str]:
+		path = self._path(namespace, key)
+		try:
+			if time.time() - path.stat().st_mtime > self.ttl:
+				return None
+			return path.read_text(encoding="utf-8")
+		except OSError:
+			return None
+
+	def put(self, namespace: str, key: str, value: str) -> None:
+		"""Store ``value``. Best-effort: a cache that can't be written is
+		simply skipped."""
+		path = self._path(namespace, key)
+		try:
+			path.parent.mkdir(parents=True, exist_ok=True)
+			# Temp file + rename so a concurrent reader never sees a partial
+			# entry. Named per thread too: relevance scores are written from
+			# a thread pool.
+			tmp = path.with_suffix(f".{os.getpid()}.{threading.get_ident()}.tmp")
+			tmp.write_text(value, encoding="utf-8")
+			tmp.replace(path)
+			self._evict(path.parent)
+		except OSError as exc:
+			print(f"[WARN] fetch cache write failed ({namespace}): {exc}")
+
+	def _evict(self, directory: Path) -> None:
+		"""Trim ``directory`` back to ``max_entries`` once it is over by more
+		than a slack of 1/8th.
+
+		The directory is only scanned every ``slack`` writes, so a put is not
+		O(entries). Other threads and processes evict the same directory, so
+		files that vanish mid-scan are skipped rather than failing the put.
+		"""
+		slack = max(1, self.max_entries // 8)
+		writes = self._writes.get(directory, 0) + 1
+		if writes < slack:
+			self._writes[directory] = writes
+			return
+		self._writes[directory] = 0
+
+		entries: List[Tuple[float, Path]] = []
+		for path in directory.glob("*.txt"):
+			try:
+				entries.append((path.stat().st_mtime, path))
+			except OSError:
+				continue
+		if len(entries) <= self.max_entries + slack:
+			return
+		entries.sort(key=lambda entry: entry[0])
+		for _, stale in entries[: len(entries) - self.max_entries]:
+			stale.unlink(missing_ok=True)
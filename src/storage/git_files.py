@@ -18,10 +18,10 @@ files become readable as bundled deployment assets.
 from __future__ import annotations
 
 import json
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from datetime import datetime
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
 from core.models import PaperCandidate, PaperSummary
 
@@ -44,6 +44,12 @@ class GitFileStore:
 	"""
 
 	data_dir: Path
+	# Parsed index.json and the (mtime_ns, size) it was read at. A run
+	# upserts one analysis at a time, so without this every paper would
+	# re-read and re-parse the whole, ever-growing index.
+	_index_cache: Optional[Tuple[Tuple[int, int], Dict[str, Any]]] = field(
+		default=None, init=False, repr=False, compare=False
+	)
 
 	@classmethod
 	def from_env(cls) -> "GitFileStore":
@@ -90,10 +96,13 @@ class GitFileStore:
 	) -> None:
 		"""Write ``data/analyses/{arxiv_id}.json`` and update the slim index."""
 		self.init_schema()
+		# One timestamp for both files, so the index entry's generated_at
+		# matches the analysis it points at.
+		generated_at = _now_iso()
 
 		# 1. Full payload
 		path = self._analysis_path(summary.paper.arxiv_id)
-		self._write_json(path, {**payload, "model": model, "generated_at": _now_iso()})
+		self._write_json(path, {**payload, "model": model, "generated_at": generated_at})
 
 		# 2. Slim index entry. The payload's title is bilingual ({en, zh});
 		# carry that into the index so the home page can render in the
@@ -110,7 +119,7 @@ class GitFileStore:
 					summary.paper.published.strftime("%Y-%m-%d")
 					if summary.paper.published else None
 				),
-				"generated_at": _now_iso(),
+				"generated_at": generated_at,
 			}
 		)
 
@@ -138,7 +147,7 @@ class GitFileStore:
 	def list_recent_analyses(
 		self, limit: int = 50, topic: Optional[str] = None
 	) -> List[Dict[str, Any]]:
-		index = self._read_json(self._index_path()) or {}
+		index = self._load_index()
 		papers = index.get("papers") or []
 		if topic:
 			papers = [p for p in papers if p.get("topic") == topic]
@@ -162,9 +171,24 @@ class GitFileStore:
 	# ------------------------------------------------------------------
 	# internal helpers
 
+	def _load_index(self) -> Dict[str, Any]:
+		"""Parsed ``index.json``, reusing the cached copy while the file's
+		mtime and size are unchanged. Callers must not mutate the result."""
+		path = self._index_path()
+		try:
+			stat = path.stat()
+		except OSError:
+			return {}
+		stamp = (stat.st_mtime_ns, stat.st_size)
+		if self._index_cache is not None and self._index_cache[0] == stamp:
+			return self._index_cache[1]
+		index = self._read_json(path) or {}
+		self._index_cache = (stamp, index)
+		return index
+
 	def _update_index(self, entry: Dict[str, Any]) -> None:
 		path = self._index_path()
-		index = self._read_json(path) or {"papers": []}
+		index = self._load_index() or {"papers": []}
 		papers: List[Dict[str, Any]] = list(index.get("papers") or [])
 		# Dedupe on arxiv_id — new entry wins (re-analyses overwrite).
 		papers = [p for p in papers if p.get("arxiv_id") != entry["arxiv_id"]]
@@ -175,7 +199,10 @@ class GitFileStore:
 			key=lambda p: (p.get("generated_at") or "", p.get("arxiv_id") or ""),
 			reverse=True,
 		)
-		self._write_json(path, {"papers": papers, "updated_at": _now_iso()})
+		index = {"papers": papers, "updated_at": _now_iso()}
+		self._write_json(path, index)
+		stat = path.stat()
+		self._index_cache = ((stat.st_mtime_ns, stat.st_size), index)
 
 	@staticmethod
 	def _read_json(path: Path) -> Optional[Dict[str, Any]]:
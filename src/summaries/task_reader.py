@@ -4,6 +4,8 @@ from __future__ import annotations
 
 import json
 import re
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from typing import Any, Dict, List, Optional, Tuple
 
 from core.llm_json import chat_json
@@ -16,6 +18,15 @@ from core.models import (
 	TaskFinding,
 	TaskItem,
 )
+from fetchers.ar5iv_parser import Ar5ivParser
+from fetchers.pdf_figure import PDFFigureExtractor
+from fetchers.pdf_parser import PDFParser
+from storage.fetch_cache import FetchCache
+
+try:  # pragma: no cover
+	from openai import OpenAI  # type: ignore[import]
+except Exception:  # pragma: no cover
+	OpenAI = None  # type: ignore[assignment]
 
 
 # How many figures to keep per paper. Each one inflates the summarisation
@@ -23,18 +34,20 @@ from core.models import (
 # token usage predictable on figure-heavy papers.
 _MAX_FIGURES_PER_PAPER = 8
 
+# Upper bound on interest questions answered by the LLM at the same time.
+# task_list_size is small, so this mostly guards against a large override.
+_MAX_ANSWER_WORKERS = 5
+
 # 5-aspect labels the classifier can assign. "experiments" figures are
 # DROPPED downstream per product decision; "none" means decorative /
 # irrelevant.
 _FIGURE_STAGES = ("problem", "solution", "methodology", "experiments", "conclusion", "none")
-from fetchers.ar5iv_parser import Ar5ivParser
-from fetchers.pdf_figure import PDFFigureExtractor
-from fetchers.pdf_parser import PDFParser
 
-try:  # pragma: no cover
-	from openai import OpenAI  # type: ignore[import]
-except Exception:  # pragma: no cover
-	OpenAI = None  # type: ignore[assignment]
+# Sentence boundaries (CJK and ASCII terminators; the abstract fallback only
+# splits on ASCII ones) and the separators between keywords in a question.
+_SENTENCE_END_RE = re.compile(r"(?<=[。！？.!?])\s+")
+_ASCII_SENTENCE_END_RE = re.compile(r"(?<=[.!?])\s+")
+_KEYWORD_SEP_RE = re.compile(r"[,，;；]")
 
 
 class TaskReader:
@@ -44,6 +57,7 @@ class TaskReader:
 		openai_config: OpenAIConfig,
 		summarization_config: SummarizationConfig,
 		mode: str = "offline",
+		fetch_cache: Optional[FetchCache] = None,
 	):
 		self.parser = parser
 		self.openai_config = openai_config
@@ -67,6 +81,7 @@ class TaskReader:
 				openai_client=self._client,
 				model=openai_config.summarization_model,
 				temperature=openai_config.temperature,
+				cache=fetch_cache,
 			)
 		else:
 			self.pdf_parser = None
@@ -74,8 +89,10 @@ class TaskReader:
 		# Cache of structured interest profiles keyed by raw interest_prompt
 		# text. Each topic's interest_prompt typically stays constant across a
 		# pipeline run, so structuring it once per process saves an LLM call
-		# per paper.
+		# per paper. Papers are analysed on several threads, so a miss is
+		# filled under a lock: one LLM call per prompt, one shared profile.
 		self._interest_cache: dict[str, dict] = {}
+		self._interest_lock = threading.Lock()
 
 	# ------------------------------------------------------------------
 
@@ -100,9 +117,6 @@ class TaskReader:
 		no usable figures.
 		``translations`` is None for English-only instances.
 		"""
-		# Import here to avoid circular dependency
-		from core.models import CoreSummary, TaskItem
-
 		figures: List[PaperFigure] = []
 		if paper.arxiv_id.startswith("demo-"):
 			markdown = paper.abstract
@@ -116,19 +130,22 @@ class TaskReader:
 				print(f"[WARN] Figure extraction failed ({paper.arxiv_id}): {exc}")
 				figures = []
 			# ar5iv usually has nothing for a just-published paper; fall back
-			# to rendering the figures straight out of the PDF.
-			if not figures and paper.pdf_url:
-				print(f"[INFO] No ar5iv figures for {paper.arxiv_id}; trying PDF extraction.")
-				try:
-					figures = self._pdf_figure.fetch_all(paper.pdf_url, paper.arxiv_id)
-				except Exception as exc:  # pragma: no cover
-					print(f"[WARN] PDF figure extraction failed ({paper.arxiv_id}): {exc}")
-					figures = []
+			# to the PDF for figures and/or text. The two fallbacks each
+			# download the PDF and are otherwise independent, so when both
+			# are needed they run side by side.
+			need_pdf_figures = not figures and bool(paper.pdf_url)
+			if need_pdf_figures and not markdown:
+				with ThreadPoolExecutor(max_workers=1) as pool:
+					figures_future = pool.submit(self._fallback_pdf_figures, paper)
+					markdown = self._fallback_to_pdf(paper)
+					figures = figures_future.result()
+			elif need_pdf_figures:
+				figures = self._fallback_pdf_figures(paper)
+			elif not markdown:
+				markdown = self._fallback_to_pdf(paper)
 			# Cap to keep the LLM prompt bounded on figure-heavy papers.
 			if len(figures) > _MAX_FIGURES_PER_PAPER:
 				figures = figures[:_MAX_FIGURES_PER_PAPER]
-			if not markdown:
-				markdown = self._fallback_to_pdf(paper)
 			if not markdown:
 				markdown = paper.abstract
 
@@ -141,9 +158,10 @@ class TaskReader:
 		# Step 2: Interest-targeted questions.
 		tasks = self._generate_interest_questions(paper, core_summary, interest_prompt, markdown)
 
-		# Step 3: Answer each question with quotes.
-		findings: List[TaskFinding] = []
-		for task in tasks:
+		# Step 3: Answer each question with quotes. The questions are
+		# independent LLM calls, so they are asked side by side; map() keeps
+		# the findings in question order.
+		def answer_task(task: TaskItem) -> TaskFinding:
 			if self._client is not None:
 				try:
 					answer, confidence = self._answer_with_quotes(paper, task, markdown)
@@ -152,8 +170,15 @@ class TaskReader:
 					answer, confidence = self._answer_heuristic(task, markdown)
 			else:
 				answer, confidence = self._answer_heuristic(task, markdown)
+			return TaskFinding(task=task, answer=answer, confidence=confidence)
 
-			findings.append(TaskFinding(task=task, answer=answer, confidence=confidence))
+		findings: List[TaskFinding]
+		if self._client is not None and len(tasks) > 1:
+			workers = min(_MAX_ANSWER_WORKERS, len(tasks))
+			with ThreadPoolExecutor(max_workers=workers) as pool:
+				findings = list(pool.map(answer_task, tasks))
+		else:
+			findings = [answer_task(task) for task in tasks]
 
 		# Step 4: Findings & summary — rewrite the 5th core aspect so it folds
 		# in what the interest Q&A turned up. Kept short.
@@ -354,7 +379,7 @@ class TaskReader:
 
 	def _answer_heuristic(self, task: TaskItem, markdown: str) -> Tuple[str, float]:
 		sentences = self._split_sentences(markdown)
-		keywords = [word.strip() for word in re.split(r"[,，;；]", task.question) if word.strip()]
+		keywords = [word.strip() for word in _KEYWORD_SEP_RE.split(task.question) if word.strip()]
 
 		matched = []
 		for sentence in sentences:
@@ -497,7 +522,7 @@ class TaskReader:
 	@staticmethod
 	def _brief_summary_heuristic(abstract: str) -> str:
 		"""Fallback: extract 1-2 paragraphs from abstract."""
-		sentences = [s for s in re.split(r'(?<=[.!?])\s+', abstract) if s.strip()]
+		sentences = [s for s in _ASCII_SENTENCE_END_RE.split(abstract) if s.strip()]
 		if not sentences:
 			return abstract.strip()[:400]
 		first_chunk = " ".join(sentences[:3]).strip()
@@ -601,9 +626,20 @@ class TaskReader:
 
 	@staticmethod
 	def _split_sentences(text: str) -> List[str]:
-		cleaned = re.sub(r"\s+", " ", text)
-		candidates = re.split(r"(?<=[。！？.!?])\s+", cleaned)
-		return [sentence.strip() for sentence in candidates if sentence.strip()]
+		# Split the raw text and collapse whitespace per sentence, instead of
+		# first building a whitespace-normalised copy of the whole document.
+		# Same result: split points sit on whitespace runs either way.
+		sentences = (" ".join(candidate.split()) for candidate in _SENTENCE_END_RE.split(text))
+		return [sentence for sentence in sentences if sentence]
+
+	def _fallback_pdf_figures(self, paper: PaperCandidate) -> List[PaperFigure]:
+		"""Render figures straight out of the PDF when ar5iv has none."""
+		print(f"[INFO] No ar5iv figures for {paper.arxiv_id}; trying PDF extraction.")
+		try:
+			return self._pdf_figure.fetch_all(paper.pdf_url, paper.arxiv_id)
+		except Exception as exc:  # pragma: no cover
+			print(f"[WARN] PDF figure extraction failed ({paper.arxiv_id}): {exc}")
+			return []
 
 	def _fallback_to_pdf(self, paper: PaperCandidate) -> Optional[str]:
 		"""Fallback to PDF parsing if ar5iv markdown fetching fails."""
@@ -925,15 +961,22 @@ Return JSON: {{"answer": "...", "confidence": 0.0-1.0}}"""
 		if cached is not None:
 			return cached
 
+		with self._interest_lock:
+			cached = self._interest_cache.get(key)
+			if cached is None:
+				cached = self._interest_cache[key] = self._build_structured_interest(key)
+			return cached
+
+	def _build_structured_interest(self, key: str) -> Dict[str, Any]:
+		"""Structure ``key`` with the LLM (or trivially when offline)."""
+
 		if self._client is None:
-			result = {
+			return {
 				"summary": key,
 				"research_questions": [],
 				"must_have_keywords": [],
 				"anti_keywords": [],
 			}
-			self._interest_cache[key] = result
-			return result
 
 		language_instruction = "Field values should be in English"
 
@@ -973,5 +1016,4 @@ Return JSON: {{"answer": "...", "confidence": 0.0-1.0}}"""
 				"anti_keywords": [],
 			}
 
-		self._interest_cache[key] = result
 		return result
@@ -3,7 +3,8 @@
 from __future__ import annotations
 
 import os
-from dataclasses import dataclass
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, replace
 from datetime import datetime, timedelta
 from typing import Iterable, List, Optional, Set, Tuple
 
@@ -22,11 +23,17 @@ from fetchers.ar5iv_parser import Ar5ivParser
 from fetchers.arxiv_client import ArxivClient
 from filters.relevance_ranker import RelevanceRanker
 from publisher.email_digest import EmailDigest
+from storage.fetch_cache import FetchCache
 from summaries.report_builder import ReportBuilder
-from summaries.task_planner import TaskPlanner
 from summaries.task_reader import TaskReader
 
 
+# Papers of one topic analysed at the same time. Each analysis already runs
+# its interest questions concurrently, so this stays small to keep the total
+# number of in-flight LLM requests modest.
+_ANALYSE_WORKERS = 3
+
+
 @dataclass
 class PipelineOverrides:
 	mode: Optional[str] = None
@@ -46,13 +53,14 @@ class PipelineOverrides:
 def run_pipeline(config_path: str, overrides: Optional[PipelineOverrides] = None) -> PipelineResult:
 	config = load_pipeline_config(config_path)
 
+	# PipelineConfig is frozen; CLI overrides produce an updated copy.
 	if overrides:
 		if overrides.mode:
-			config.runtime.mode = overrides.mode
+			config = replace(config, runtime=replace(config.runtime, mode=overrides.mode))
 		if overrides.paper_limit is not None:
-			config.runtime.paper_limit = overrides.paper_limit
+			config = replace(config, runtime=replace(config.runtime, paper_limit=overrides.paper_limit))
 		if overrides.email_enabled is not None:
-			config.email.enabled = overrides.email_enabled
+			config = replace(config, email=replace(config.email, enabled=overrides.email_enabled))
 
 	# Determine fetch windows. Backfill mode if both dates are present.
 	backfill = bool(overrides and overrides.start_date and overrides.end_date)
@@ -71,13 +79,6 @@ def run_pipeline(config_path: str, overrides: Optional[PipelineOverrides] = None
 		print("[INFO] DRY-RUN: will fetch candidates and count only; no LLM calls.")
 
 	arxiv_client = ArxivClient(fetch_config=config.fetch)
-	ranker = RelevanceRanker(config.openai, config.relevance, mode=config.runtime.mode)
-	parser = Ar5ivParser()
-	# planner kept for backwards-compat side-effects, even though the new
-	# analyse() flow does not consume its output.
-	planner = TaskPlanner(config.openai, config.summarization, mode=config.runtime.mode)
-	reader = TaskReader(parser, config.openai, config.summarization, mode=config.runtime.mode)
-	report_builder = ReportBuilder(config.summarization)
 	# site.base_url now points at the Vercel app — used to build "view full
 	# report" links inside the weekly email digest.
 	email_digest = EmailDigest(
@@ -108,121 +109,138 @@ def run_pipeline(config_path: str, overrides: Optional[PipelineOverrides] = None
 		print(f"[INFO] Loaded {len(seen_ids)} existing arxiv_ids from data/ for dedup")
 
 	start_time = datetime.utcnow()
+	if dry_run:
+		return _run_dry_run(config, arxiv_client, windows, backfill, seen_ids, start_time)
+
+	# A dry run has returned above, so the scoring and analysis components
+	# (each with its own OpenAI client and HTTP sessions) are only built for
+	# a real run. The analyse() flow no longer consumes
+	# TaskPlanner output, so no planner is built at all.
+	fetch_cache = FetchCache.from_env()
+	ranker = RelevanceRanker(
+		config.openai, config.relevance, mode=config.runtime.mode, cache=fetch_cache
+	)
+	parser = Ar5ivParser(cache=fetch_cache)
+	reader = TaskReader(
+		parser, config.openai, config.summarization, mode=config.runtime.mode, fetch_cache=fetch_cache
+	)
+	report_builder = ReportBuilder(config.summarization)
+
 	summaries: List[PaperSummary] = []
 	total_fetched = 0
 	total_selected = 0
-	dryrun_counts: List[Tuple[str, str, int]] = []  # (window, topic, count)
-
-	for win_idx, (win_start, win_end) in enumerate(windows, start=1):
-		if backfill:
-			print(
-				f"[INFO] === Window {win_idx}/{len(windows)}: "
-				f"{win_start.date()} → {win_end.date()} ==="
-			)
-
-		for topic_index, topic in enumerate(config.topics, start=1):
-			print(
-				f"[INFO] ({topic_index}/{len(config.topics)}) Fetching papers for topic: {topic.label}"
-			)
-			candidates = arxiv_client.fetch_for_topic(
-				topic, start_date=win_start, end_date=win_end
-			)
-			total_fetched += len(candidates)
 
-			# Deduplicate against earlier windows in this run AND existing manifest.
-			before_dedup = len(candidates)
-			candidates = [c for c in candidates if c.arxiv_id not in seen_ids]
-			if before_dedup - len(candidates) > 0:
+	# Fetching is network-bound and analysis is LLM-bound, so topic fetches
+	# run ahead, in order, on one background thread while this loop scores
+	# and analyses. A single worker keeps arXiv requests sequential, so the
+	# client's process-wide throttle still holds.
+	fetch_pool = ThreadPoolExecutor(max_workers=1, thread_name_prefix="arxiv-fetch")
+	prefetched = iter([
+		fetch_pool.submit(arxiv_client.fetch_for_topic, topic, start_date=win_start, end_date=win_end)
+		for win_start, win_end in windows
+		for topic in config.topics
+	])
+	try:
+		for win_idx, (win_start, win_end) in enumerate(windows, start=1):
+			if backfill:
 				print(
-					f"[INFO] Topic {topic.label}: deduped {before_dedup - len(candidates)} already-processed papers"
+					f"[INFO] === Window {win_idx}/{len(windows)}: "
+					f"{win_start.date()} → {win_end.date()} ==="
 				)
-			print(f"[INFO] Topic {topic.label}: {len(candidates)} new candidates")
 
-			if dry_run:
-				dryrun_counts.append(
-					(
-						f"{win_start.date()}→{win_end.date()}" if backfill else "current",
-						topic.label,
-						len(candidates),
-					)
+			for topic_index, topic in enumerate(config.topics, start=1):
+				print(
+					f"[INFO] ({topic_index}/{len(config.topics)}) Fetching papers for topic: {topic.label}"
 				)
-				# Reserve their IDs so we don't double-count across windows.
-				seen_ids.update(c.arxiv_id for c in candidates)
-				continue
-
-			if not candidates and config.runtime.mode == "offline":
-				print("[INFO] No live arXiv results; generating offline demo candidate.")
-				candidates = [_build_offline_demo_candidate(topic)]
+				candidates = next(prefetched).result()
+				total_fetched += len(candidates)
+
+				# Deduplicate against earlier windows in this run AND existing manifest.
+				before_dedup = len(candidates)
+				candidates = [c for c in candidates if c.arxiv_id not in seen_ids]
+				if before_dedup - len(candidates) > 0:
+					print(
+						f"[INFO] Topic {topic.label}: deduped {before_dedup - len(candidates)} already-processed papers"
+					)
+				print(f"[INFO] Topic {topic.label}: {len(candidates)} new candidates")
 
-			if not candidates:
-				print(f"[WARN] No candidates available for topic {topic.label}; skipping.")
-				continue
+				if not candidates and config.runtime.mode == "offline":
+					print("[INFO] No live arXiv results; generating offline demo candidate.")
+					candidates = [_build_offline_demo_candidate(topic)]
 
-			if config.runtime.paper_limit is not None:
-				candidates = candidates[: config.runtime.paper_limit]
-				print(
-					f"[INFO] Topic {topic.label}: applying paper limit {config.runtime.paper_limit}, using {len(candidates)} candidates"
-				)
+				if not candidates:
+					print(f"[WARN] No candidates available for topic {topic.label}; skipping.")
+					continue
 
-			scored = ranker.score(topic, candidates)
-			selected = _filter_by_threshold(scored, config)
-			print(
-				f"[INFO] Topic {topic.label}: scored {len(scored)} papers, {len(selected)} passed threshold {config.relevance.pass_threshold}"
-			)
-			total_selected += len(selected)
+				if config.runtime.paper_limit is not None:
+					candidates = candidates[: config.runtime.paper_limit]
+					print(
+						f"[INFO] Topic {topic.label}: applying paper limit {config.runtime.paper_limit}, using {len(candidates)} candidates"
+					)
 
-			total_weight = sum(dim.weight for dim in config.relevance.dimensions) or 1.0
-			for paper_index, scored_paper in enumerate(selected, start=1):
-				normalised_score = (scored_paper.total_score / total_weight) * 100
+				scored = ranker.score(topic, candidates)
+				selected = _filter_by_threshold(scored, config)
 				print(
-					f"[INFO] Topic {topic.label}: processing paper {paper_index}/{len(selected)} "
-					f"[{scored_paper.paper.arxiv_id}] {scored_paper.paper.title} — score {normalised_score:.1f}"
-				)
-				core_summary, tasks, findings, brief_summary, _, relevance, figures, translations = reader.analyse(
-					scored_paper.paper,
-					topic.interest_prompt,
-				)
-				summary = report_builder.build(
-					topic=topic,
-					scored_paper=scored_paper,
-					core_summary=core_summary,
-					task_list=tasks,
-					findings=findings,
-					brief_summary=brief_summary,
-					relevance=relevance,
-					figures=figures,
-					translations=translations,
+					f"[INFO] Topic {topic.label}: scored {len(scored)} papers, {len(selected)} passed threshold {config.relevance.pass_threshold}"
 				)
-				summaries.append(summary)
-				seen_ids.add(summary.paper.arxiv_id)
-				if file_store is not None:
-					try:
-						file_store.upsert_analysis(
-							summary,
-							payload=_summary_to_payload(summary, markdown=""),
-							model=config.openai.summarization_model,
-						)
-					except Exception as exc:
-						print(f"[WARN] file-storage write failed for {summary.paper.arxiv_id}: {exc}")
-				print(
-					f"[INFO] Topic {topic.label}: completed summary for {scored_paper.paper.arxiv_id}, total summaries {len(summaries)}"
+				total_selected += len(selected)
+				if not selected:
+					continue
+				parser.prefetch(
+					sp.paper.arxiv_id for sp in selected
+					if not sp.paper.arxiv_id.startswith("demo-")
 				)
 
-	if dry_run:
-		print("\n[INFO] DRY-RUN summary (papers that WOULD be processed):")
-		for win, topic_label, cnt in dryrun_counts:
-			print(f"  [{win}] {topic_label}: {cnt}")
-		total = sum(cnt for _, _, cnt in dryrun_counts)
-		print(f"  TOTAL: {total} unique candidate papers across all windows")
-		end_time = datetime.utcnow()
-		stats = PipelineStats(
-			start_time=start_time,
-			end_time=end_time,
-			topics_processed=len(config.topics),
-			papers_fetched=total_fetched,
-			papers_selected=0,
-		)
-		return PipelineResult(summaries=[], stats=stats)
+				total_weight = sum(dim.weight for dim in config.relevance.dimensions) or 1.0
+				# Structure the topic's interest once, here, rather than
+				# leaving the first few workers to race for it.
+				reader.get_structured_interest(topic.interest_prompt)
+
+				def analyse(indexed: Tuple[int, ScoredPaper]):
+					paper_index, scored_paper = indexed
+					normalised_score = (scored_paper.total_score / total_weight) * 100
+					print(
+						f"[INFO] Topic {topic.label}: processing paper {paper_index}/{len(selected)} "
+						f"[{scored_paper.paper.arxiv_id}] {scored_paper.paper.title} — score {normalised_score:.1f}"
+					)
+					return reader.analyse(scored_paper.paper, topic.interest_prompt)
+
+				# Each analysis is a chain of LLM calls, so a few papers are
+				# analysed side by side. map() hands results back in selection
+				# order, so summaries and data/ writes stay ordered and happen
+				# on this thread.
+				workers = max(1, min(_ANALYSE_WORKERS, len(selected)))
+				with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="analyse") as analyse_pool:
+					analyses = analyse_pool.map(analyse, enumerate(selected, start=1))
+					for scored_paper, analysis in zip(selected, analyses):
+						core_summary, tasks, findings, brief_summary, _, relevance, figures, translations = analysis
+						summary = report_builder.build(
+							topic=topic,
+							scored_paper=scored_paper,
+							core_summary=core_summary,
+							task_list=tasks,
+							findings=findings,
+							brief_summary=brief_summary,
+							relevance=relevance,
+							figures=figures,
+							translations=translations,
+						)
+						summaries.append(summary)
+						seen_ids.add(summary.paper.arxiv_id)
+						if file_store is not None:
+							try:
+								file_store.upsert_analysis(
+									summary,
+									payload=_summary_to_payload(summary, markdown=""),
+									model=config.openai.summarization_model,
+								)
+							except Exception as exc:
+								print(f"[WARN] file-storage write failed for {summary.paper.arxiv_id}: {exc}")
+						print(
+							f"[INFO] Topic {topic.label}: completed summary for {scored_paper.paper.arxiv_id}, total summaries {len(summaries)}"
+						)
+	finally:
+		fetch_pool.shutdown(wait=False, cancel_futures=True)
 
 	# Analyses are already written to data/*.json by file_store inside the
 	# topic loop above; the wrapping workflow commits them. There is no
@@ -247,6 +265,66 @@ def run_pipeline(config_path: str, overrides: Optional[PipelineOverrides] = None
 	return PipelineResult(summaries=summaries, stats=stats)
 
 
+def _run_dry_run(
+	config: PipelineConfig,
+	arxiv_client: ArxivClient,
+	windows: List[Tuple[Optional[datetime], Optional[datetime]]],
+	backfill: bool,
+	seen_ids: Set[str],
+	start_time: datetime,
+) -> PipelineResult:
+	"""Fetch and count each window's new candidates; no scoring, no LLM calls."""
+
+	total_fetched = 0
+	dryrun_counts: List[Tuple[str, str, int]] = []  # (window, topic, count)
+	for win_idx, (win_start, win_end) in enumerate(windows, start=1):
+		if backfill:
+			print(
+				f"[INFO] === Window {win_idx}/{len(windows)}: "
+				f"{win_start.date()} → {win_end.date()} ==="
+			)
+
+		for topic_index, topic in enumerate(config.topics, start=1):
+			print(
+				f"[INFO] ({topic_index}/{len(config.topics)}) Fetching papers for topic: {topic.label}"
+			)
+			candidates = arxiv_client.fetch_for_topic(topic, start_date=win_start, end_date=win_end)
+			total_fetched += len(candidates)
+
+			before_dedup = len(candidates)
+			candidates = [c for c in candidates if c.arxiv_id not in seen_ids]
+			if before_dedup - len(candidates) > 0:
+				print(
+					f"[INFO] Topic {topic.label}: deduped {before_dedup - len(candidates)} already-processed papers"
+				)
+			print(f"[INFO] Topic {topic.label}: {len(candidates)} new candidates")
+
+			dryrun_counts.append(
+				(
+					f"{win_start.date()}→{win_end.date()}" if backfill else "current",
+					topic.label,
+					len(candidates),
+				)
+			)
+			# Reserve their IDs so we don't double-count across windows.
+			seen_ids.update(c.arxiv_id for c in candidates)
+
+	print("\n[INFO] DRY-RUN summary (papers that WOULD be processed):")
+	for win, topic_label, cnt in dryrun_counts:
+		print(f"  [{win}] {topic_label}: {cnt}")
+	total = sum(cnt for _, _, cnt in dryrun_counts)
+	print(f"  TOTAL: {total} unique candidate papers across all windows")
+	end_time = datetime.utcnow()
+	stats = PipelineStats(
+		start_time=start_time,
+		end_time=end_time,
+		topics_processed=len(config.topics),
+		papers_fetched=total_fetched,
+		papers_selected=0,
+	)
+	return PipelineResult(summaries=[], stats=stats)
+
+
 def _split_windows(
 	start: datetime, end: datetime, chunk_days: int
 ) -> List[Tuple[datetime, datetime]]:
@@ -277,8 +355,8 @@ def _filter_by_threshold(scored_papers: Iterable[ScoredPaper], config: PipelineC
 
 def _build_offline_demo_candidate(topic: TopicConfig) -> PaperCandidate:
 	now = datetime.utcnow()
-	keywords = topic.query.include or [topic.label]
-	categories = topic.query.categories or ["cs.AI"]
+	keywords = list(topic.query.include) or [topic.label]
+	categories = list(topic.query.categories) or ["cs.AI"]
 	keyword_str = ", ".join(keywords)
 	category_str = ", ".join(categories)
 	abstract = (
@@ -343,14 +421,19 @@ def run_analyse_one(
 	# Score relevance the same way the weekly pipeline does. A manually
 	# submitted paper isn't automatically relevant — the user still wants an
 	# honest "how well does this match my interests" number.
-	ranker = RelevanceRanker(config.openai, config.relevance, mode=config.runtime.mode)
+	fetch_cache = FetchCache.from_env()
+	ranker = RelevanceRanker(
+		config.openai, config.relevance, mode=config.runtime.mode, cache=fetch_cache
+	)
 	scored = ranker.score(topic, [paper])
 	scored_paper = scored[0] if scored else ScoredPaper(
 		paper=paper, scores=[], total_score=0.0,
 	)
 
-	parser = Ar5ivParser()
-	reader = TaskReader(parser, config.openai, config.summarization, mode=config.runtime.mode)
+	parser = Ar5ivParser(cache=fetch_cache)
+	reader = TaskReader(
+		parser, config.openai, config.summarization, mode=config.runtime.mode, fetch_cache=fetch_cache
+	)
 	core_summary, tasks, findings, brief_summary, markdown, relevance, figures, translations = reader.analyse(
 		paper, topic.interest_prompt
 	)
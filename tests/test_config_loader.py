@@ -0,0 +1,55 @@
+"""Tests for the caches behind load_pipeline_config."""
+
+import copy
+import shutil
+import sys
+from pathlib import Path
+
+import pytest
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.core.config_loader import _read_yaml, load_pipeline_config
+
+
+PIPELINE_YAML = Path(__file__).parent.parent / "config" / "pipeline.yaml"
+
+
+@pytest.fixture
+def config_path(tmp_path, monkeypatch):
+	"""A private copy of the shipped config, so its cache keys are unique."""
+	path = tmp_path / "pipeline.yaml"
+	shutil.copyfile(PIPELINE_YAML, path)
+	monkeypatch.setenv("BASE_URL", "https://example.invalid/v1")
+	return path
+
+
+def _cached_raw(path: Path) -> dict:
+	return _read_yaml(str(path.resolve()), path.stat().st_mtime_ns)
+
+
+def test_reload_sees_new_env_without_touching_cached_parse(config_path, monkeypatch):
+	monkeypatch.setenv("API_KEY", "first-key")
+	first = load_pipeline_config(config_path, print_summary=False)
+	raw_before = copy.deepcopy(_cached_raw(config_path))
+
+	monkeypatch.setenv("API_KEY", "second-key")
+	second = load_pipeline_config(config_path, print_summary=False)
+
+	assert first.openai.api_key == "first-key"
+	assert second.openai.api_key == "second-key"
+	# The parse is shared between loads; expansion must not write into it.
+	assert _cached_raw(config_path) == raw_before
+	assert _cached_raw(config_path)["openai"]["api_key"] == "${API_KEY}"
+
+
+def test_unsetting_required_var_revalidates(config_path, monkeypatch, capsys):
+	monkeypatch.setenv("API_KEY", "valid-key")
+	config = load_pipeline_config(config_path, validate=True, print_summary=False)
+	assert config.runtime.mode == "online"
+
+	monkeypatch.delenv("API_KEY")
+	with pytest.raises(SystemExit):
+		load_pipeline_config(config_path, validate=True, print_summary=True)
+	assert "openai.api_key" in capsys.readouterr().out
@@ -0,0 +1,89 @@
+"""Tests for the on-disk fetch cache."""
+
+import os
+import sys
+import time
+from pathlib import Path
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.storage.fetch_cache import FetchCache
+
+
+def _age(path: Path, seconds: float) -> None:
+	"""Push a file's mtime ``seconds`` into the past."""
+	stamp = time.time() - seconds
+	os.utime(path, (stamp, stamp))
+
+
+def test_put_then_get(tmp_path):
+	cache = FetchCache(cache_dir=tmp_path)
+	cache.put("ar5iv", "2401.00001", "# Title\n\nbody")
+
+	assert cache.get("ar5iv", "2401.00001") == "# Title\n\nbody"
+	assert cache.get("ar5iv", "2401.00002") is None
+	# Namespaces are separate.
+	assert cache.get("pdf_text", "2401.00001") is None
+
+
+def test_put_overwrites(tmp_path):
+	cache = FetchCache(cache_dir=tmp_path)
+	cache.put("ar5iv", "key", "old")
+	cache.put("ar5iv", "key", "new")
+
+	assert cache.get("ar5iv", "key") == "new"
+	assert not list((tmp_path / "ar5iv").glob("*.tmp"))
+
+
+def test_expired_entry_is_a_miss(tmp_path):
+	cache = FetchCache(cache_dir=tmp_path, ttl=60)
+	cache.put("ar5iv", "key", "value")
+
+	_age(cache._path("ar5iv", "key"), 30)
+	assert cache.get("ar5iv", "key") == "value"
+
+	_age(cache._path("ar5iv", "key"), 120)
+	assert cache.get("ar5iv", "key") is None
+
+
+def test_from_env_zero_ttl_disables_cache(tmp_path, monkeypatch):
+	monkeypatch.setenv("FETCH_CACHE_DIR", str(tmp_path))
+	monkeypatch.setenv("FETCH_CACHE_TTL", "0")
+	assert FetchCache.from_env() is None
+
+	monkeypatch.setenv("FETCH_CACHE_TTL", "5")
+	cache = FetchCache.from_env()
+	assert cache is not None
+	assert cache.cache_dir == tmp_path
+	assert cache.ttl == 5
+
+
+def test_eviction_keeps_newest_entries(tmp_path):
+	cache = FetchCache(cache_dir=tmp_path, max_entries=8)
+	for i in range(40):
+		cache.put("scores", f"key-{i}", str(i))
+		# Distinct, increasing mtimes so "oldest" is well defined.
+		_age(cache._path("scores", f"key-{i}"), 1000 - i)
+
+	slack = max(1, cache.max_entries // 8)
+	remaining = list((tmp_path / "scores").glob("*.txt"))
+	assert len(remaining) <= cache.max_entries + 2 * slack
+	assert cache.get("scores", "key-39") == "39"
+	assert cache.get("scores", "key-0") is None
+
+
+def test_eviction_skips_vanished_entries(tmp_path, capsys):
+	cache = FetchCache(cache_dir=tmp_path, max_entries=1)
+	namespace = tmp_path / "scores"
+	namespace.mkdir()
+	# A dangling symlink globs as an entry but fails to stat, like a file
+	# another process evicted mid-scan.
+	(namespace / "gone.txt").symlink_to(namespace / "missing")
+
+	cache.put("scores", "a", "1")
+	cache.put("scores", "b", "2")
+	cache.put("scores", "c", "3")
+
+	assert "[WARN]" not in capsys.readouterr().out
+	assert cache.get("scores", "c") == "3"
@@ -0,0 +1,99 @@
+"""Tests for the concurrent per-topic analysis in run_pipeline."""
+
+import sys
+import time
+from pathlib import Path
+from types import SimpleNamespace
+
+import pytest
+
+# The pipeline modules import each other as top-level packages (core.*,
+# fetchers.*, ...), so put src itself on the path.
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+pytest.importorskip("dateutil")
+
+from workflow import pipeline  # noqa: E402
+
+
+class _StubReader:
+	def __init__(self, *args, **kwargs):
+		self.interest_calls = 0
+
+	def get_structured_interest(self, interest_prompt):
+		self.interest_calls += 1
+		return {}
+
+	def analyse(self, paper, interest_prompt):
+		# Earlier papers take longest, so they finish last.
+		time.sleep(paper.delay)
+		return (None, [], [], paper.arxiv_id, "", "", [], None)
+
+
+class _StubStore:
+	def init_schema(self):
+		raise RuntimeError("no storage in tests")
+
+
+def _run(monkeypatch, papers, pass_threshold=0.0):
+	topic = SimpleNamespace(label="Topic", interest_prompt="interest")
+	config = SimpleNamespace(
+		topics=[topic],
+		fetch=None,
+		email=None,
+		site=SimpleNamespace(base_url=""),
+		openai=SimpleNamespace(language="en", summarization_model="model"),
+		relevance=SimpleNamespace(dimensions=[SimpleNamespace(weight=1.0)], pass_threshold=pass_threshold),
+		summarization=None,
+		runtime=SimpleNamespace(mode="online", paper_limit=None),
+	)
+	readers = []
+
+	def make_reader(*args, **kwargs):
+		readers.append(_StubReader())
+		return readers[-1]
+
+	monkeypatch.setattr(pipeline, "load_pipeline_config", lambda path: config)
+	monkeypatch.setattr(pipeline, "ArxivClient", lambda fetch_config: SimpleNamespace(
+		fetch_for_topic=lambda topic, start_date=None, end_date=None: list(papers)
+	))
+	monkeypatch.setattr(pipeline, "FetchCache", SimpleNamespace(from_env=lambda: None))
+	monkeypatch.setattr(pipeline, "RelevanceRanker", lambda *args, **kwargs: SimpleNamespace(
+		score=lambda topic, candidates: [SimpleNamespace(paper=c, total_score=c.score) for c in candidates]
+	))
+	monkeypatch.setattr(pipeline, "Ar5ivParser", lambda cache=None: SimpleNamespace(prefetch=lambda ids: list(ids)))
+	monkeypatch.setattr(pipeline, "TaskReader", make_reader)
+	monkeypatch.setattr(pipeline, "ReportBuilder", lambda config: SimpleNamespace(
+		build=lambda scored_paper, brief_summary, **kwargs: SimpleNamespace(
+			paper=scored_paper.paper, brief_summary=brief_summary
+		)
+	))
+	monkeypatch.setattr(pipeline, "EmailDigest", lambda *args, **kwargs: SimpleNamespace(send=lambda *a: None))
+	monkeypatch.setattr(pipeline, "_build_file_store", _StubStore)
+
+	result = pipeline.run_pipeline("unused.yaml")
+	return result, readers[0]
+
+
+def test_summaries_keep_selection_order(monkeypatch):
+	assert pipeline._ANALYSE_WORKERS > 1
+	papers = [
+		SimpleNamespace(arxiv_id=f"2401.0000{i}", title=f"Paper {i}", score=1.0, delay=0.05 * (5 - i))
+		for i in range(5)
+	]
+
+	result, reader = _run(monkeypatch, papers)
+
+	assert [s.paper.arxiv_id for s in result.summaries] == [p.arxiv_id for p in papers]
+	# Each summary was built from its own paper's analysis.
+	assert [s.brief_summary for s in result.summaries] == [p.arxiv_id for p in papers]
+	assert reader.interest_calls == 1
+
+
+def test_topic_without_selected_papers_skips_analysis(monkeypatch):
+	papers = [SimpleNamespace(arxiv_id="2401.00001", title="Paper", score=0.0, delay=0.0)]
+
+	result, reader = _run(monkeypatch, papers, pass_threshold=50.0)
+
+	assert result.summaries == []
+	assert reader.interest_calls == 0